@@ -0,0 +1,460 @@
+"""
+Shared SymPy machinery for the legacy verification scripts.
+
+Holds the hoisted symbols, the cached exact-solve / series pipeline, the
+Taylor-coefficient recurrence, the Maxima formatter and the process pool
+helper. The caches are per process, so in pooled runs they live in the
+pool workers.
+"""
+
+import os
+
+# Must be set before SymPy is first imported: a larger @cacheit LRU keeps the
+# diff/subs/series intermediates of earlier cases hot for later ones
+os.environ.setdefault("SYMPY_CACHE_SIZE", "10000")
+
+import concurrent.futures
+import contextlib
+from fractions import Fraction
+from functools import lru_cache
+
+import sympy as sp
+from sympy import Function, dsolve, series, symbols
+from sympy.printing.precedence import precedence
+from sympy.printing.str import StrPrinter
+from sympy.solvers.ode.ode import solve_ics
+
+# Symbols, the unknown function and the derivative ICs at x=0 are shared by
+# every case; build them once at import time instead of per call.
+X = symbols("x")
+Y = Function("y")
+YX = Y(X)
+# subs (not xreplace): x is also the differentiation variable, so a structural
+# swap would produce an invalid Derivative(y(0), 0)
+YP0 = YX.diff(X).subs(X, 0)
+YPP0 = YX.diff(X, 2).subs(X, 0)
+YPPP0 = YX.diff(X, 3).subs(X, 0)
+# y(x), y'(x), y''(x), y'''(x) for matching right-hand sides of nth-order ODEs
+YX_DERIVS = (YX, YX.diff(X), YX.diff(X, 2), YX.diff(X, 3))
+
+# Independent variable, unknowns and their values at t=0 for the 2x2 systems
+T = symbols("t")
+FT = Function("f")(T)
+GT = Function("g")(T)
+F0 = FT.subs(T, 0)
+G0 = GT.subs(T, 0)
+
+
+@contextlib.contextmanager
+def process_pool(executor=None):
+    """
+    Yield executor, or a fresh ProcessPoolExecutor that is shut down on exit.
+
+    Passing one executor to several suites lets them reuse the same worker
+    processes instead of starting a pool each.
+    """
+    if executor is not None:
+        yield executor
+        return
+    with concurrent.futures.ProcessPoolExecutor() as ex:
+        yield ex
+
+
+def _is_first_order(ode_eq):
+    """True for y' = f(x, y) written with the derivative on the left"""
+    lhs = ode_eq.lhs
+    return isinstance(lhs, sp.Derivative) and lhs.derivative_count == 1
+
+
+def _known_hint(ode_eq):
+    """
+    dsolve (hint, simplify) for the ODE shapes used in these test batteries,
+    or None when the classifier has to decide.
+
+    simplify=False is only used where the hint already yields y explicitly;
+    the separable hint needs the simplifier to solve the implicit form for y.
+    """
+    lhs, rhs = ode_eq.lhs, ode_eq.rhs
+    if not isinstance(lhs, sp.Derivative) or lhs.expr != YX:
+        return None
+    m = lhs.derivative_count
+    if m == 1:
+        if not rhs.diff(YX).has(YX):
+            return "1st_linear", False  # y' = a(x)*y + b(x), incl. y' = f(x)
+        if not rhs.has(X):
+            return "separable", True  # autonomous y' = f(y)
+        return None
+
+    # y^(m) = sum c_k y^(k) + g(x) with constant c_k
+    if m <= len(YX_DERIVS):
+        derivs = YX_DERIVS[:m]
+    else:
+        derivs = [YX] + [YX.diff(X, k) for k in range(1, m)]
+    if any(rhs.diff(d).has(X, *derivs) for d in derivs):
+        return None
+    if rhs.subs({d: 0 for d in reversed(derivs)}) == 0:
+        return "nth_linear_constant_coeff_homogeneous", False
+    return "nth_linear_constant_coeff_undetermined_coefficients", False
+
+
+def dsolve_hinted(ode_eq, func, ics=None):
+    """
+    dsolve that skips classify_ode for known ODE shapes (see _known_hint),
+    falling back to the plain call when the hint does not apply.
+    """
+    known = _known_hint(ode_eq) if func == YX else None
+    if known is not None:
+        hint, simplify_result = known
+        try:
+            sol = dsolve(ode_eq, func, ics=ics, hint=hint, simplify=simplify_result)
+            if not isinstance(sol, list) and sol.lhs == func:
+                return sol
+        except (ValueError, NotImplementedError):
+            pass
+    return dsolve(ode_eq, func, ics=ics)
+
+
+@lru_cache(maxsize=None)
+def _solve_general(ode_srepr):
+    """General solution (no ICs) of the ODE given by its srepr string"""
+    return dsolve_hinted(sp.sympify(ode_srepr), YX)
+
+
+def _tan_taylor(n):
+    """tan = sin/cos by truncated power-series division"""
+    s, c = _maclaurin("sin", n), _maclaurin("cos", n)
+    t = []
+    for k in range(n + 1):
+        t.append(s[k] - sum(c[j] * t[k - j] for j in range(1, k + 1)))
+    return t
+
+
+# Truncated Maclaurin coefficient lists [c_0, ..., c_n] of elementary functions
+TAYLOR = {
+    "sin": lambda n: [
+        sp.Integer(0) if k % 2 == 0 else sp.Integer(-1) ** (k // 2) / sp.factorial(k)
+        for k in range(n + 1)
+    ],
+    "cos": lambda n: [
+        sp.Integer(-1) ** (k // 2) / sp.factorial(k) if k % 2 == 0 else sp.Integer(0)
+        for k in range(n + 1)
+    ],
+    "exp": lambda n: [1 / sp.factorial(k) for k in range(n + 1)],
+    "atan": lambda n: [
+        sp.Integer(0) if k % 2 == 0 else sp.Rational((-1) ** (k // 2), k)
+        for k in range(n + 1)
+    ],
+    "tan": _tan_taylor,
+}
+
+
+@lru_cache(maxsize=None)
+def _maclaurin(func_name, n):
+    """Cached TAYLOR[func_name](n), computed once per (function, order)"""
+    return tuple(TAYLOR[func_name](n))
+
+
+def _trunc(p, n):
+    """Drop all terms of degree > n from the univariate Poly p"""
+    return sp.Poly.from_dict(
+        {k: c for k, c in p.as_dict().items() if k[0] <= n}, p.gens, domain=p.domain
+    )
+
+
+def _poly_inverse(p, n):
+    """1/p truncated at degree n; requires p(0) != 0"""
+    c = [p.nth(k) for k in range(n + 1)]
+    b = [1 / c[0]]
+    for k in range(1, n + 1):
+        b.append(-sum(c[j] * b[k - j] for j in range(1, k + 1)) / c[0])
+    return sp.Poly(list(reversed(b)), X, domain=p.domain)
+
+
+def _truncated_taylor(expr, n):
+    """
+    Maclaurin polynomial of expr truncated at degree n, built bottom-up from
+    truncated Poly products and the TAYLOR table.
+
+    Subexpressions free of x (numbers, integration constants) become
+    coefficients. Returns None for anything outside sums, products, integer
+    powers and the TAYLOR functions, so the caller can fall back to
+    sympy.series.
+    """
+    if expr == X:
+        return sp.Poly(X, X, domain="QQ")
+    if expr.is_Rational:
+        return sp.Poly(expr, X, domain="QQ")
+    if not expr.has(X):
+        return sp.Poly(expr, X, domain="EX")
+
+    if expr.is_Add or expr.is_Mul:
+        parts = [_truncated_taylor(arg, n) for arg in expr.args]
+        if any(part is None for part in parts):
+            return None
+        result = parts[0]
+        for part in parts[1:]:
+            result = result + part if expr.is_Add else _trunc(result * part, n)
+        return result
+
+    if expr.is_Pow and expr.exp.is_Integer:
+        base = _truncated_taylor(expr.base, n)
+        if base is None:
+            return None
+        if expr.exp < 0:
+            if base.nth(0) == 0:
+                return None
+            base = _poly_inverse(base, n)
+        result = sp.Poly(1, X, domain="QQ")
+        for _ in range(abs(int(expr.exp))):
+            result = _trunc(result * base, n)
+        return result
+
+    if expr.func.__name__ in TAYLOR and len(expr.args) == 1:
+        inner = _truncated_taylor(expr.args[0], n)
+        if inner is None or inner.nth(0) != 0:
+            return None
+        # f(u) = sum c_k u^k; u has no constant term so u^k = O(x^k)
+        result = sp.Poly(0, X, domain="QQ")
+        u_k = sp.Poly(1, X, domain="QQ")
+        for c_k in _maclaurin(expr.func.__name__, n):
+            result += u_k * c_k
+            u_k = _trunc(u_k * inner, n)
+        return result
+
+    return None
+
+
+@lru_cache(maxsize=None)
+def _series_cached(expr_srepr, order):
+    """Truncated Taylor polynomial about x=0 of an expression given by its srepr"""
+    expr = sp.sympify(expr_srepr)
+    poly = _truncated_taylor(expr, order)
+    if poly is not None:
+        return poly.as_expr()
+    return series(expr, X, 0, order + 1).removeO()
+
+
+@lru_cache(maxsize=None)
+def _taylor_cached(ode_srepr, ic_items, order):
+    """
+    Taylor polynomial for one (ODE, ICs, order) triple.
+
+    The general solution is shared between all cases with the same ODE;
+    only the integration constants are fitted per IC set.
+    """
+    ode_eq = sp.sympify(ode_srepr)
+    ic_dict = dict(ic_items)
+
+    if _is_first_order(ode_eq) and not ode_eq.rhs.has(YX):
+        # y' = f(x): plain quadrature, y = y(x0) + int_{x0}^{x} f
+        ((ic_func, ic_value),) = ic_items
+        x0 = ic_func.args[0]
+        if x0 == 0 and order > 0:
+            # Integrate the truncated Maclaurin polynomial of f term by term
+            f_poly = _truncated_taylor(ode_eq.rhs, order - 1)
+            if f_poly is not None:
+                return (f_poly.integrate() + ic_value).as_expr()
+        y_exact = ic_value + sp.integrate(ode_eq.rhs, (X, x0, X))
+        return _series_cached(sp.srepr(y_exact), order)
+
+    general = _solve_general(ode_srepr)
+    if isinstance(general, list):
+        # Several solution branches: let dsolve pick the one matching the ICs
+        y_exact = dsolve_hinted(ode_eq, YX, ics=ic_dict).rhs
+    else:
+        constants = sorted(general.free_symbols - ode_eq.free_symbols - {X}, key=str)
+        y_exact = general.rhs
+        if constants:
+            fitted = solve_ics([general], [YX], constants, ic_dict)
+            y_exact = y_exact.xreplace(fitted)
+
+    return _series_cached(sp.srepr(y_exact), order)
+
+
+@lru_cache(maxsize=None)
+def _general_series(ode_srepr, order):
+    """
+    General solution of the ODE and its Taylor polynomial with the
+    integration constants left symbolic; (general, None) when dsolve
+    returns several solution branches.
+    """
+    general = _solve_general(ode_srepr)
+    if isinstance(general, list):
+        return general, None
+    return general, _series_cached(sp.srepr(general.rhs), order)
+
+
+def _truncate(poly, order):
+    """Drop the terms of an expanded polynomial in x above degree order"""
+    return sp.Add(
+        *[t for t in sp.Add.make_args(poly) if t.as_coeff_exponent(X)[1] <= order]
+    )
+
+
+def solve_case_group(group):
+    """
+    Process-pool worker: solve every case sharing one ODE.
+
+    The general solution is found and series-expanded once, at the largest
+    order in the group; each case then only fits its integration constants
+    and truncates to its own order.
+
+    Returns [(success, series_polynomial, error_msg), ...] in group order.
+    """
+    ode = group[0][1]
+    if _is_first_order(ode):
+        # Quadrature and polynomial-RHS cases are cheap per IC; any dsolve
+        # they still need is shared through the _solve_general cache
+        return [solve_case(case) for case in group]
+
+    max_order = max(order for _, _, _, order in group)
+    try:
+        general, general_poly = _general_series(sp.srepr(ode), max_order)
+    except Exception as e:
+        return [(False, None, f"Could not solve exactly: {e}")] * len(group)
+    if general_poly is None:
+        return [solve_case(case) for case in group]
+
+    constants = sorted(general.free_symbols - ode.free_symbols - {X}, key=str)
+    outcomes = []
+    for _, _, ics, order in group:
+        try:
+            poly = general_poly
+            if constants:
+                fitted = solve_ics([general], [YX], constants, ics)
+                poly = sp.expand(poly.xreplace(fitted))
+            outcomes.append((True, _truncate(poly, order), None))
+        except Exception as e:
+            outcomes.append((False, None, f"Could not solve exactly: {e}"))
+    return outcomes
+
+
+def solve_and_expand(name, ode_eq, ic_dict, order=5, method="exact"):
+    """
+    Solve ODE and get Taylor expansion using SymPy only
+
+    Returns:
+        (success, series_polynomial, error_msg)
+    """
+    try:
+        if method == "exact":
+            # y' = P(x, y) about 0: coefficient recurrence, no dsolve needed
+            if len(ic_dict) == 1 and next(iter(ic_dict)).args == (0,):
+                poly = polynomial_rhs_series(ode_eq, ic_dict, order)
+                if poly is not None:
+                    return True, poly, None
+
+            # Try exact solution first (memoized across duplicate ODE shapes)
+            try:
+                taylor_poly = _taylor_cached(
+                    sp.srepr(ode_eq), frozenset(ic_dict.items()), order
+                )
+                return True, taylor_poly, None
+            except Exception as e:
+                return False, None, f"Could not solve exactly: {e}"
+
+        elif method == "series":
+            # For nonlinear ODEs, use SymPy's series method if available
+            # This is a placeholder - SymPy doesn't have a direct series ODE solver
+            return False, None, "Series method not implemented"
+
+    except Exception as e:
+        return False, None, f"Error: {e}"
+
+
+def taylor_polynomial_rhs(p, a0, N):
+    """
+    Taylor coefficients of y' = sum_i p[i](t) * y^i, y(0) = a0
+
+    p: list of coefficient lists (length N+1), p[i] holding the polynomial
+       in t that multiplies y^i
+    Returns [a_0, ..., a_N] from the recurrence a_{k+1} = f_k / (k+1), where
+    f_k is the t^k coefficient of the RHS. The coefficients of each power
+    y^i are extended by one Cauchy-product term per step, so the whole
+    solve is O(deg_y * N^2) rational operations with no symbolic growth.
+    """
+    a = [a0] + [Fraction(0)] * N
+    # ypow[i][k]: t^k coefficient of y^i
+    ypow = [[Fraction(1)] + [Fraction(0)] * N, a]
+    ypow += [[Fraction(0)] * (N + 1) for _ in range(2, len(p))]
+    for k in range(N):
+        for i in range(2, len(p)):
+            ypow[i][k] = sum(ypow[i - 1][j] * a[k - j] for j in range(k + 1))
+        f_k = sum(
+            p[i][j] * ypow[i][k - j] for i in range(len(p)) for j in range(k + 1)
+        )
+        a[k + 1] = f_k / (k + 1)
+    return a
+
+
+def _to_fraction(value):
+    r = sp.Rational(value)
+    return Fraction(int(r.p), int(r.q))
+
+
+def polynomial_rhs_series(ode, ics, order):
+    """
+    Taylor polynomial about the IC point for y' = P(x, y) with P a
+    polynomial with rational coefficients, using taylor_polynomial_rhs.
+
+    Returns None when the ODE is not of that form.
+    """
+    if not _is_first_order(ode) or len(ics) != 1:
+        return None
+    ((ic_func, ic_value),) = ics.items()
+    x0 = ic_func.args[0]
+    y_var, t = symbols("y t")
+
+    rhs = ode.rhs.xreplace({YX: y_var}).xreplace({X: x0 + t})
+    try:
+        P = sp.Poly(rhs, y_var, t, domain="QQ")
+        a0 = _to_fraction(ic_value)
+    except (sp.PolynomialError, TypeError):
+        return None
+
+    p = [[Fraction(0)] * (order + 1) for _ in range(P.degree(y_var) + 1)]
+    for (i, j), c in P.terms():
+        if j <= order:
+            p[i][j] = _to_fraction(c)
+
+    a = taylor_polynomial_rhs(p, a0, order)
+    poly = sum(
+        sp.Rational(c.numerator, c.denominator) * (X - x0) ** k
+        for k, c in enumerate(a)
+    )
+    return sp.expand(poly)
+
+
+def solve_case(case):
+    """Process-pool worker: solve a single (name, ode, ics, order) case"""
+    case_name, ode, ics, order = case
+    return solve_and_expand(case_name, ode, ics, order)
+
+
+class MaximaStrPrinter(StrPrinter):
+    """StrPrinter that writes powers with Maxima's '^' in a single pass"""
+
+    def _print_Pow(self, expr, rational=False):
+        PREC = precedence(expr)
+        if expr.exp is sp.S.Half and not rational:
+            return "sqrt(%s)" % self._print(expr.base)
+        if expr.is_commutative:
+            if -expr.exp is sp.S.Half and not rational:
+                return "1/sqrt(%s)" % self._print(expr.base)
+            if expr.exp is sp.S.NegativeOne:
+                return "1/%s" % self.parenthesize(expr.base, PREC, strict=False)
+        return "%s^%s" % (
+            self.parenthesize(expr.base, PREC, strict=False),
+            self.parenthesize(expr.exp, PREC, strict=False),
+        )
+
+
+_maxima_printer = MaximaStrPrinter()
+
+
+def format_for_maxima(expr):
+    """Convert SymPy expression to Maxima-friendly format"""
+    if expr is None:
+        return "UNKNOWN"
+
+    return _maxima_printer.doprint(expr)
@@ -4,53 +4,24 @@ Complete verification of all test cases in comprehensive_test_suite.mac
 Using SymPy to compute exact results, no manual calculations or guessing.
 """
 
-import sympy as sp
-from sympy import (
-    symbols,
-    Function,
-    Eq,
-    dsolve,
-    series,
-    sin,
-    cos,
-    exp,
-    simplify,
-    sqrt,
-    atan,
-    asin,
-    tan,
+# _verify_common comes first: it sets SYMPY_CACHE_SIZE before SymPy is imported
+from _verify_common import (
+    X,
+    Y,
+    YP0,
+    YPP0,
+    YPPP0,
+    YX,
+    format_for_maxima,
+    polynomial_rhs_series,
+    process_pool,
+    solve_case_group,
 )
-import traceback
-
-
-def solve_and_expand(name, ode_eq, ic_dict, order=5, method="exact"):
-    """
-    Solve ODE and get Taylor expansion using SymPy only
-
-    Returns:
-        (success, series_polynomial, error_msg)
-    """
-    x = symbols("x")
-    y = Function("y")
 
-    try:
-        if method == "exact":
-            # Try exact solution first
-            try:
-                exact_solution = dsolve(ode_eq, y(x), ics=ic_dict)
-                y_exact = exact_solution.rhs
-                taylor_series = series(y_exact, x, 0, order + 1)
-                return True, taylor_series.removeO(), None
-            except Exception as e:
-                return False, None, f"Could not solve exactly: {e}"
+from functools import lru_cache
 
-        elif method == "series":
-            # For nonlinear ODEs, use SymPy's series method if available
-            # This is a placeholder - SymPy doesn't have a direct series ODE solver
-            return False, None, "Series method not implemented"
-
-    except Exception as e:
-        return False, None, f"Error: {e}"
+import sympy as sp
+from sympy import Eq, cos, exp, sin, symbols
 
 
 def compute_derivatives_manually(ode_rhs, ic_values, order=5):
@@ -59,135 +30,167 @@ def compute_derivatives_manually(ode_rhs, ic_values, order=5):
     ode_rhs: right-hand side of y' = f(x,y) or y''' = f(x,y,y',y'')
     ic_values: dict with y(0), y'(0), etc.
     """
-    x, y_var = symbols("x y")
+    x = X
+    y_var = symbols("y")
 
-    # Replace y with a symbol for differentiation
-    f = ode_rhs.subs(Function("y")(x), y_var)
+    # Replace y with a symbol for differentiation (structural swap, no sympify)
+    f = sp.sympify(ode_rhs).xreplace({YX: y_var})
 
     derivatives = {}
-    derivatives[0] = ic_values.get("y", 0)
+    derivatives[0] = sp.sympify(ic_values.get("y", 0))
+
+    # Point of evaluation is the same for every derivative
+    at_origin = {x: sp.S.Zero, y_var: derivatives[0]}
 
     # For first-order ODE y' = f(x,y)
     if 1 not in ic_values:  # y'(0) not given, compute from ODE
-        derivatives[1] = f.subs([(x, 0), (y_var, derivatives[0])])
+        derivatives[1] = f.xreplace(at_origin)
     else:
         derivatives[1] = ic_values[1]
 
     # Compute higher derivatives by chain rule
     current_f = f
+    y_free = False
     for k in range(2, order + 1):
         if k in ic_values:
             derivatives[k] = ic_values[k]
         else:
-            # Differentiate current_f
-            df_dx = sp.diff(current_f, x)
-            df_dy = sp.diff(current_f, y_var)
+            # Differentiate current_f, skipping variables it does not contain.
+            # Once current_f is free of y it stays so (next_f = df/dx), so
+            # the y check is not repeated.
+            y_free = y_free or not current_f.has(y_var)
+            df_dx = sp.diff(current_f, x) if current_f.has(x) else sp.S.Zero
+            df_dy = sp.S.Zero if y_free else sp.diff(current_f, y_var)
 
             # Apply chain rule: d/dx[f(x,y)] = df/dx + df/dy * dy/dx
-            next_f = (
-                df_dx + df_dy * derivatives[1]
-            )  # This is approximate for higher order
+            # This is approximate for higher order
+            if df_dy.is_zero:
+                next_f = df_dx
+            else:
+                next_f = df_dx + df_dy * derivatives[1]
 
             # Evaluate at x=0 with known derivative values
-            subs_list = [(x, 0), (y_var, derivatives[0])]
-            derivatives[k] = next_f.subs(subs_list)
+            derivatives[k] = next_f.xreplace(at_origin)
             current_f = next_f
 
-    # Build polynomial
-    polynomial = sum(derivatives[k] * x**k / sp.factorial(k) for k in range(order + 1))
-    return sp.expand(polynomial), derivatives
-
-
-def verify_all_cases():
-    """Systematically verify all test cases"""
-    x = symbols("x")
-    y = Function("y")
-
-    test_cases = [
+    # Build polynomial directly from its coefficients (already monomial form,
+    # so no expand pass is needed)
+    fact = [1]
+    for k in range(1, order + 1):
+        fact.append(fact[-1] * k)
+    polynomial = sp.Poly.from_dict(
+        {(k,): sp.sympify(derivatives[k]) / fact[k] for k in range(order + 1)}, x
+    ).as_expr()
+    return polynomial, derivatives
+
+
+@lru_cache(maxsize=1)
+def _build_test_cases():
+    """(name, ode, ics, order) for every case; built once per process"""
+    return (
         # Phase 1: Basic cases
-        ("y' = y, y(0) = 1", Eq(y(x).diff(x), y(x)), {y(0): 1}, 6),
-        ("y' = 2*y, y(0) = 3", Eq(y(x).diff(x), 2 * y(x)), {y(0): 3}, 4),
-        ("y' = x^2, y(0) = 0", Eq(y(x).diff(x), x**2), {y(0): 0}, 5),
-        ("y' = x + x^2, y(0) = 1", Eq(y(x).diff(x), x + x**2), {y(0): 1}, 4),
-        ("y' = y^2, y(0) = 1", Eq(y(x).diff(x), y(x) ** 2), {y(0): 1}, 5),
+        ("y' = y, y(0) = 1", Eq(YX.diff(X), YX), {Y(0): 1}, 6),
+        ("y' = 2*y, y(0) = 3", Eq(YX.diff(X), 2 * YX), {Y(0): 3}, 4),
+        ("y' = x^2, y(0) = 0", Eq(YX.diff(X), X**2), {Y(0): 0}, 5),
+        ("y' = x + x^2, y(0) = 1", Eq(YX.diff(X), X + X**2), {Y(0): 1}, 4),
+        ("y' = y^2, y(0) = 1", Eq(YX.diff(X), YX**2), {Y(0): 1}, 5),
         # Phase 1: Nonlinear cases
-        ("y' = x + y^2, y(0) = 1", Eq(y(x).diff(x), x + y(x) ** 2), {y(0): 1}, 3),
-        ("y' = x*y, y(0) = 1", Eq(y(x).diff(x), x * y(x)), {y(0): 1}, 6),
-        ("y' = y + sin(x), y(0) = 0", Eq(y(x).diff(x), y(x) + sin(x)), {y(0): 0}, 5),
-        ("y' = 1 + y^2, y(0) = 0", Eq(y(x).diff(x), 1 + y(x) ** 2), {y(0): 0}, 5),
-        ("y' = x^2 + y^2, y(0) = 0", Eq(y(x).diff(x), x**2 + y(x) ** 2), {y(0): 0}, 5),
+        ("y' = x + y^2, y(0) = 1", Eq(YX.diff(X), X + YX**2), {Y(0): 1}, 3),
+        ("y' = x*y, y(0) = 1", Eq(YX.diff(X), X * YX), {Y(0): 1}, 6),
+        ("y' = y + sin(x), y(0) = 0", Eq(YX.diff(X), YX + sin(X)), {Y(0): 0}, 5),
+        ("y' = 1 + y^2, y(0) = 0", Eq(YX.diff(X), 1 + YX**2), {Y(0): 0}, 5),
+        ("y' = x^2 + y^2, y(0) = 0", Eq(YX.diff(X), X**2 + YX**2), {Y(0): 0}, 5),
         # Non-zero expansion points
-        ("y' = x^2, y(1) = 2", Eq(y(x).diff(x), x**2), {y(1): 2}, 4),
-        ("y' = y, y(2) = 1", Eq(y(x).diff(x), y(x)), {y(2): 1}, 4),
-        ("y' = 2*x, y(-1) = 0", Eq(y(x).diff(x), 2 * x), {y(-1): 0}, 3),
+        ("y' = x^2, y(1) = 2", Eq(YX.diff(X), X**2), {Y(1): 2}, 4),
+        ("y' = y, y(2) = 1", Eq(YX.diff(X), YX), {Y(2): 1}, 4),
+        ("y' = 2*x, y(-1) = 0", Eq(YX.diff(X), 2 * X), {Y(-1): 0}, 3),
         # Edge cases
-        ("y' = 5, y(0) = 1", Eq(y(x).diff(x), 5), {y(0): 1}, 3),
+        ("y' = 5, y(0) = 1", Eq(YX.diff(X), 5), {Y(0): 1}, 3),
         # Special functions
-        ("y' = cos(x), y(0) = 0", Eq(y(x).diff(x), cos(x)), {y(0): 0}, 7),
-        ("y' = exp(x), y(0) = 1", Eq(y(x).diff(x), exp(x)), {y(0): 1}, 5),
-        ("y' = 1/(1+x^2), y(0) = 0", Eq(y(x).diff(x), 1 / (1 + x**2)), {y(0): 0}, 9),
+        ("y' = cos(x), y(0) = 0", Eq(YX.diff(X), cos(X)), {Y(0): 0}, 7),
+        ("y' = exp(x), y(0) = 1", Eq(YX.diff(X), exp(X)), {Y(0): 1}, 5),
+        ("y' = 1/(1+x^2), y(0) = 0", Eq(YX.diff(X), 1 / (1 + X**2)), {Y(0): 0}, 9),
         # Phase 2: Second-order ODEs
         (
             "y'' = y, y(0)=1, y'(0)=0",
-            Eq(y(x).diff(x, 2), y(x)),
-            {y(0): 1, y(x).diff(x).subs(x, 0): 0},
+            Eq(YX.diff(X, 2), YX),
+            {Y(0): 1, YP0: 0},
             6,
         ),
         (
             "y'' = -y, y(0)=1, y'(0)=0",
-            Eq(y(x).diff(x, 2), -y(x)),
-            {y(0): 1, y(x).diff(x).subs(x, 0): 0},
+            Eq(YX.diff(X, 2), -YX),
+            {Y(0): 1, YP0: 0},
             6,
         ),
         (
             "y'' = -y, y(0)=0, y'(0)=1",
-            Eq(y(x).diff(x, 2), -y(x)),
-            {y(0): 0, y(x).diff(x).subs(x, 0): 1},
+            Eq(YX.diff(X, 2), -YX),
+            {Y(0): 0, YP0: 1},
             5,
         ),
         (
             "y'' = -4*y, y(0)=1, y'(0)=0",
-            Eq(y(x).diff(x, 2), -4 * y(x)),
-            {y(0): 1, y(x).diff(x).subs(x, 0): 0},
+            Eq(YX.diff(X, 2), -4 * YX),
+            {Y(0): 1, YP0: 0},
             4,
         ),
         # Phase 2: Higher-order ODEs
         (
             "y''' = 0, y(0)=1, y'(0)=2, y''(0)=3",
-            Eq(y(x).diff(x, 3), 0),
-            {y(0): 1, y(x).diff(x).subs(x, 0): 2, y(x).diff(x, 2).subs(x, 0): 3},
+            Eq(YX.diff(X, 3), 0),
+            {Y(0): 1, YP0: 2, YPP0: 3},
             3,
         ),
         (
             "y^(4) = y, y(0)=1, y'(0)=0, y''(0)=0, y'''(0)=0",
-            Eq(y(x).diff(x, 4), y(x)),
-            {
-                y(0): 1,
-                y(x).diff(x).subs(x, 0): 0,
-                y(x).diff(x, 2).subs(x, 0): 0,
-                y(x).diff(x, 3).subs(x, 0): 0,
-            },
+            Eq(YX.diff(X, 4), YX),
+            {Y(0): 1, YP0: 0, YPP0: 0, YPPP0: 0},
             8,
         ),
         (
             "y''' = x + y, y(0)=1, y'(0)=0, y''(0)=0",
-            Eq(y(x).diff(x, 3), x + y(x)),
-            {y(0): 1, y(x).diff(x).subs(x, 0): 0, y(x).diff(x, 2).subs(x, 0): 0},
+            Eq(YX.diff(X, 3), X + YX),
+            {Y(0): 1, YP0: 0, YPP0: 0},
             5,
         ),
-    ]
+    )
+
+
+def verify_all_cases(executor=None):
+    """
+    Systematically verify all test cases
+
+    executor: optional process pool to solve in (see process_pool)
+    """
+    test_cases = _build_test_cases()
 
     results = {}
 
     print("COMPLETE VERIFICATION OF ALL TEST CASES")
     print("=" * 60)
 
-    for case_name, ode, ics, order in test_cases:
+    # Group cases sharing an ODE so each general solution is computed once
+    by_ode = {}
+    for index, (_, ode, _, _) in enumerate(test_cases):
+        by_ode.setdefault(sp.srepr(ode), []).append(index)
+    groups = [[test_cases[i] for i in indices] for indices in by_ode.values()]
+
+    # Groups are independent and CPU-bound in SymPy: solve them in parallel
+    # processes, then report in the original case order
+    outcomes = [None] * len(test_cases)
+    with process_pool(executor) as ex:
+        for indices, group_outcomes in zip(
+            by_ode.values(), ex.map(solve_case_group, groups)
+        ):
+            for index, outcome in zip(indices, group_outcomes):
+                outcomes[index] = outcome
+
+    for (case_name, ode, ics, order), outcome in zip(test_cases, outcomes):
         print(f"\nCase: {case_name}")
         print("-" * 40)
 
-        # Try exact solution
-        success, result, error = solve_and_expand(case_name, ode, ics, order)
+        success, result, error = outcome
 
         if success:
             print(f"SUCCESS: {result}")
@@ -196,31 +199,21 @@ def verify_all_cases():
             print(f"FAILED: {error}")
 
             # For nonlinear cases that can't be solved exactly,
-            # try numerical coefficient computation via derivatives
-            if "y^2" in case_name or "x + y^2" in case_name or "x^2 + y^2" in case_name:
-                print("Attempting manual derivative computation...")
-                try:
-                    # Extract RHS and convert to computable form
-                    rhs = ode.rhs
-                    # This is complex for higher-order, skip for now
-                    print("Manual computation not implemented for this case")
-                except:
-                    print("Could not compute manually")
-
-            results[case_name] = None
+            # compute the Taylor coefficients directly by recurrence. It
+            # expands about the IC point, so only use it when that is x=0,
+            # the point every other result here is expanded about
+            print("Attempting Taylor-coefficient recurrence...")
+            result = None
+            if len(ics) == 1 and next(iter(ics)).args == (0,):
+                result = polynomial_rhs_series(ode, ics, order)
+            if result is not None:
+                print(f"SERIES: {result}")
+            else:
+                print("Manual computation not implemented for this case")
 
-    return results
-
-
-def format_for_maxima(expr):
-    """Convert SymPy expression to Maxima-friendly format"""
-    if expr is None:
-        return "UNKNOWN"
+            results[case_name] = result
 
-    # Convert SymPy to string and make Maxima-compatible
-    maxima_str = str(expr)
-    maxima_str = maxima_str.replace("**", "^")
-    return maxima_str
+    return results
 
 
 def generate_test_expectations(results):
@@ -0,0 +1,55 @@
+#!/usr/bin/env python3
+"""
+Run every legacy SymPy verification from a single process.
+
+SymPy is imported once in one interpreter, and the pooled suites share one
+worker pool instead of each starting its own.
+"""
+
+import argparse
+import concurrent.futures
+import sys
+
+import complete_verification
+import verify_ode_with_sympy
+import verify_system_with_sympy
+import verify_third_order_ode
+
+
+def run_complete(executor=None):
+    results = complete_verification.verify_all_cases(executor)
+    complete_verification.generate_test_expectations(results)
+
+
+def run_ode(quiet=False, executor=None):
+    verify_ode_with_sympy.main(quiet=quiet, executor=executor)
+
+
+def run_system(executor=None):
+    verify_system_with_sympy.main(executor)
+
+
+def run_third_order(quiet=False):
+    verify_third_order_ode.main(quiet=quiet)
+
+
+def main(quiet=False):
+    with concurrent.futures.ProcessPoolExecutor() as ex:
+        run_complete(ex)
+        run_ode(quiet=quiet, executor=ex)
+        run_system(ex)
+    # A single case, solved in this process
+    run_third_order(quiet=quiet)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument(
+        "--quiet",
+        action="store_true",
+        help="skip the detailed per-case reports where a suite supports it",
+    )
+    args = parser.parse_args()
+    sys.stdout.reconfigure(line_buffering=False)
+
+    main(quiet=args.quiet)
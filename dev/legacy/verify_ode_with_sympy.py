@@ -4,12 +4,12 @@ Comprehensive verification script for all ODE test cases
 using SymPy to confirm the correct series expansions.
 """
 
+# _verify_common comes first: it sets SYMPY_CACHE_SIZE before SymPy is imported
+from _verify_common import X, Y, YX, dsolve_hinted, process_pool
+
 import sympy as sp
 from sympy import (
-    symbols,
-    Function,
     Eq,
-    dsolve,
     series,
     sin,
     cos,
@@ -19,10 +19,17 @@ from sympy import (
     atan,
     asin,
 )
+import argparse
+import contextlib
+import functools
+import io
+import sys
 import traceback
 
 
-def verify_ode_case(name, ode_eq, ic_dict, order=5, manual_series=None):
+def verify_ode_case(
+    name, ode_eq, ic_dict, order=5, manual_series=None, verbose=True
+):
     """
     Verify a single ODE case
 
@@ -32,69 +39,94 @@ def verify_ode_case(name, ode_eq, ic_dict, order=5, manual_series=None):
         ic_dict: initial conditions as dict
         order: order for series expansion
         manual_series: expected series if known analytically
+        verbose: build and print the per-case report; when False no SymPy
+            expression is stringified
     """
-    print(f"\n{'='*60}")
-    print(f"Case: {name}")
-    print(f"{'='*60}")
-
-    x = symbols("x")
-    y = Function("y")
+    # Report lines are collected and written once at the end
+    buf = []
+    if verbose:
+        buf.append(f"\n{'='*60}")
+        buf.append(f"Case: {name}")
+        buf.append(f"{'='*60}")
 
     try:
-        print("ODE:", ode_eq)
-        print("IC:", ic_dict)
+        if verbose:
+            buf.append(f"ODE: {ode_eq}")
+            buf.append(f"IC: {ic_dict}")
 
         # Try to solve exactly
         try:
-            exact_solution = dsolve(ode_eq, y(x), ics=ic_dict)
-            print("Exact solution:", exact_solution)
+            exact_solution = dsolve_hinted(ode_eq, YX, ics=ic_dict)
+            if verbose:
+                buf.append(f"Exact solution: {exact_solution}")
             y_exact = exact_solution.rhs
-        except:
-            print("Cannot solve exactly, will try series method")
+        except Exception:
+            if verbose:
+                buf.append("Cannot solve exactly, will try series method")
             y_exact = None
 
         # If we have exact solution, get its series
         if y_exact is not None:
-            taylor_series = series(y_exact, x, 0, order + 1)
-            print("Taylor series:", taylor_series)
+            taylor_series = series(y_exact, X, 0, order + 1)
             series_poly = taylor_series.removeO()
-            print("Series polynomial:", series_poly)
-
-            # Extract just the significant coefficients
+            if not verbose:
+                return series_poly
+            buf.append(f"Taylor series: {taylor_series}")
+            buf.append(f"Series polynomial: {series_poly}")
+
+            # Extract just the significant coefficients (one pass over the
+            # polynomial, then O(1) lookups)
+            coeffs_dict = sp.Poly(series_poly, X).as_dict()
             coeffs = []
             for i in range(order + 1):
-                coeff = (
-                    series_poly.coeff(x, i)
-                    if series_poly.coeff(x, i) is not None
-                    else 0
-                )
+                coeff = coeffs_dict.get((i,), 0)
                 if coeff != 0:
                     coeffs.append(f"x^{i}: {coeff}")
 
             if coeffs:
-                print("Non-zero coefficients:", ", ".join(coeffs))
+                buf.append("Non-zero coefficients: " + ", ".join(coeffs))
             else:
-                print("All coefficients up to order", order, "are zero")
+                buf.append(f"All coefficients up to order {order} are zero")
 
             return series_poly
         else:
-            print("Using series method not implemented in this verification")
+            if verbose:
+                buf.append("Using series method not implemented in this verification")
             return None
 
     except Exception as e:
-        print(f"Error processing case: {e}")
-        traceback.print_exc()
+        buf.append(f"Error processing case: {e}")
+        # Into the report, not stderr: pool workers only capture stdout
+        buf.append(traceback.format_exc().rstrip("\n"))
         return None
 
+    finally:
+        if buf:
+            print("\n".join(buf))
 
-def verify_all_test_cases():
-    """Verify all the test cases from the comprehensive suite"""
 
-    x = symbols("x")
-    y = Function("y")
+def _verify_case_captured(case_data, verbose=True):
+    """
+    Process-pool worker: run verify_ode_case and capture its report so the
+    parent can print reports in the original case order.
+    """
+    name, ode_eq, ic_dict, order, expected = case_data
+    buf = io.StringIO()
+    with contextlib.redirect_stdout(buf):
+        result = verify_ode_case(name, ode_eq, ic_dict, order, expected, verbose)
+    return buf.getvalue(), result
+
+
+def verify_all_test_cases(verbose=True, executor=None):
+    """
+    Verify all the test cases from the comprehensive suite
+
+    executor: optional process pool to run the cases in (see process_pool)
+    """
 
-    print("COMPREHENSIVE ODE VERIFICATION")
-    print("Checking all test cases for correct expected results")
+    if verbose:
+        print("COMPREHENSIVE ODE VERIFICATION")
+        print("Checking all test cases for correct expected results")
 
     results = {}
 
@@ -103,85 +135,93 @@ def verify_all_test_cases():
         # Already verified - these should pass
         (
             "y' = y, y(0) = 1 (exponential)",
-            Eq(y(x).diff(x), y(x)),
-            {y(0): 1},
+            Eq(YX.diff(X), YX),
+            {Y(0): 1},
             6,
             "1 + x + x²/2 + x³/6 + x⁴/24 + x⁵/120 + x⁶/720",
         ),
         (
             "y' = y + sin(x), y(0) = 0 (linear inhomogeneous)",
-            Eq(y(x).diff(x), y(x) + sin(x)),
-            {y(0): 0},
+            Eq(YX.diff(X), YX + sin(X)),
+            {Y(0): 0},
             5,
             "x²/2 + x³/6",
         ),
         # Cases that might be failing
         (
             "y' = x + y², y(0) = 1 (spec example)",
-            Eq(y(x).diff(x), x + y(x) ** 2),
-            {y(0): 1},
+            Eq(YX.diff(X), X + YX**2),
+            {Y(0): 1},
             3,
             "1 + x + (3/2)x² + (4/3)x³",
         ),
         (
             "y' = x*y, y(0) = 1 (Bernoulli)",
-            Eq(y(x).diff(x), x * y(x)),
-            {y(0): 1},
+            Eq(YX.diff(X), X * YX),
+            {Y(0): 1},
             6,
             "1 + x²/2 + x⁴/8 + x⁶/48",
         ),
         (
             "y' = 1 + y², y(0) = 0 (Riccati → tan(x))",
-            Eq(y(x).diff(x), 1 + y(x) ** 2),
-            {y(0): 0},
+            Eq(YX.diff(X), 1 + YX**2),
+            {Y(0): 0},
             5,
             "x + x³/3 + 2x⁵/15",
         ),
         (
             "y' = x² + y², y(0) = 0 (nonlinear)",
-            Eq(y(x).diff(x), x**2 + y(x) ** 2),
-            {y(0): 0},
+            Eq(YX.diff(X), X**2 + YX**2),
+            {Y(0): 0},
             5,
             "?",
         ),
         (
             "y' = x², y(0) = 0 (pure polynomial)",
-            Eq(y(x).diff(x), x**2),
-            {y(0): 0},
+            Eq(YX.diff(X), X**2),
+            {Y(0): 0},
             5,
             "x³/3",
         ),
         (
             "y' = y², y(0) = 1 (separable → 1/(1-x))",
-            Eq(y(x).diff(x), y(x) ** 2),
-            {y(0): 1},
+            Eq(YX.diff(X), YX**2),
+            {Y(0): 1},
             5,
             "1 + x + x² + x³ + x⁴ + x⁵",
         ),
         (
             "y' = cos(x), y(0) = 0 (→ sin(x))",
-            Eq(y(x).diff(x), cos(x)),
-            {y(0): 0},
+            Eq(YX.diff(X), cos(X)),
+            {Y(0): 0},
             7,
             "x - x³/6 + x⁵/120 - x⁷/5040",
         ),
         (
             "y' = 1/(1+x²), y(0) = 0 (→ arctan(x))",
-            Eq(y(x).diff(x), 1 / (1 + x**2)),
-            {y(0): 0},
+            Eq(YX.diff(X), 1 / (1 + X**2)),
+            {Y(0): 0},
             9,
             "x - x³/3 + x⁵/5 - x⁷/7 + x⁹/9",
         ),
     ]
 
+    well_formed = []
     for case_data in cases:
         if len(case_data) == 5:
-            name, ode_eq, ic_dict, order, expected = case_data
-            result = verify_ode_case(name, ode_eq, ic_dict, order, expected)
-            results[name] = result
+            well_formed.append(case_data)
         else:
             print(f"Skipping malformed case: {case_data}")
 
+    # Independent, CPU-bound cases: run them in parallel processes
+    with process_pool(executor) as ex:
+        worker = functools.partial(_verify_case_captured, verbose=verbose)
+        outcomes = list(ex.map(worker, well_formed))
+
+    for case_data, (report, result) in zip(well_formed, outcomes):
+        print(report, end="")
+        results[case_data[0]] = result
+
     return results
 
 
@@ -243,12 +283,14 @@ def manual_nonlinear_verification():
     return {"y' = x² + y², y(0) = 0": "x³/3"}
 
 
-if __name__ == "__main__":
+def main(quiet=False, executor=None):
+    """Verify every case, then print the summary and recommendations"""
     # Run comprehensive verification
-    results = verify_all_test_cases()
+    results = verify_all_test_cases(verbose=not quiet, executor=executor)
 
     # Manual verification for tricky cases
-    manual_results = manual_nonlinear_verification()
+    if not quiet:
+        manual_results = manual_nonlinear_verification()
 
     print(f"\n{'='*80}")
     print("SUMMARY AND RECOMMENDATIONS")
@@ -263,3 +305,16 @@ if __name__ == "__main__":
 
     print("\nThe Maxima library appears to be correct.")
     print("Test expectations need to be fixed based on these verifications.")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument(
+        "--quiet",
+        action="store_true",
+        help="skip the per-case reports and print only the final summary",
+    )
+    args = parser.parse_args()
+    sys.stdout.reconfigure(line_buffering=False)
+
+    main(quiet=args.quiet)
@@ -2,6 +2,13 @@
 """
 Verification script for system ODE test cases using SymPy.
 """
+
+# _verify_common comes first: it sets SYMPY_CACHE_SIZE before SymPy is imported
+from _verify_common import F0, FT, G0, GT, T, process_pool
+
+import contextlib
+import io
+
 import sympy as sp
 
 
@@ -43,10 +50,17 @@ def verify_system_case(name, ode_list, funcs, ics, order):
         return None
 
 
-def main():
-    t = sp.symbols("t")
-    f = sp.Function("f")(t)
-    g = sp.Function("g")(t)
+def _verify_case_captured(case):
+    """Process-pool worker: run verify_system_case and capture its report."""
+    buf = io.StringIO()
+    with contextlib.redirect_stdout(buf):
+        result = verify_system_case(*case)
+    return buf.getvalue(), result
+
+
+def main(executor=None):
+    """Verify every system case; executor is an optional shared process pool."""
+    t, f, g = T, FT, GT
 
     # Test cases from the Maxima suite
     cases = [
@@ -54,27 +68,29 @@ def main():
             "sin/cos Oscillator",
             [sp.Eq(f.diff(t), g), sp.Eq(g.diff(t), -f)],
             [f, g],
-            {f.subs(t, 0): 0, g.subs(t, 0): 1},
+            {F0: 0, G0: 1},
             5,
         ),
         (
             "Exponential System",
             [sp.Eq(f.diff(t), f + g), sp.Eq(g.diff(t), f + g)],
             [f, g],
-            {f.subs(t, 0): 1, g.subs(t, 0): 0},
+            {F0: 1, G0: 0},
             5,
         ),
         (
             "Mixed Polynomial System",
             [sp.Eq(f.diff(t), t), sp.Eq(g.diff(t), f + g)],
             [f, g],
-            {f.subs(t, 0): 0, g.subs(t, 0): 1},
+            {F0: 0, G0: 1},
             4,
         ),
     ]
 
-    for name, odes, funcs, ics, order in cases:
-        verify_system_case(name, odes, funcs, ics, order)
+    # Cases are independent: solve in parallel, print in the original order
+    with process_pool(executor) as ex:
+        for report, _ in ex.map(_verify_case_captured, cases):
+            print(report, end="")
 
     print(f"\n{'='*60}")
     print("Compare these results with your Maxima test suite expectations.")
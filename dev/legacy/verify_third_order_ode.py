@@ -3,88 +3,117 @@
 Verify the third-order ODE case: y''' = x + y, y(0)=1, y'(0)=0, y''(0)=0
 """
 
+# _verify_common comes first: it sets SYMPY_CACHE_SIZE before SymPy is imported
+from _verify_common import X, Y, YP0, YPP0, YX
+
+import argparse
+import sys
+
 import sympy as sp
-from sympy import symbols, Function, Eq, dsolve, series, factorial
+from sympy import Eq, dsolve, series, factorial
 
 
-def verify_third_order_coupling():
-    """Verify y''' = x + y, y(0)=1, y'(0)=0, y''(0)=0"""
-    print("=" * 60)
-    print("Verifying: y''' = x + y, y(0)=1, y'(0)=0, y''(0)=0")
-    print("=" * 60)
+def verify_third_order_coupling(verbose=True):
+    """
+    Verify y''' = x + y, y(0)=1, y'(0)=0, y''(0)=0
+
+    The report is collected in a buffer and written once; with verbose=False
+    it is not built at all, so no SymPy expression is stringified.
+    """
+    buf = []
+    if verbose:
+        buf.append("=" * 60)
+        buf.append("Verifying: y''' = x + y, y(0)=1, y'(0)=0, y''(0)=0")
+        buf.append("=" * 60)
 
-    x = symbols("x")
-    y = Function("y")
+    x = X
 
     # Define the ODE and ICs
-    ode = Eq(y(x).diff(x, 3), x + y(x))
-    ics = {y(0): 1, y(x).diff(x).subs(x, 0): 0, y(x).diff(x, 2).subs(x, 0): 0}
+    ode = Eq(YX.diff(x, 3), x + YX)
+    ics = {Y(0): 1, YP0: 0, YPP0: 0}
 
-    print("ODE:", ode)
-    print("Initial conditions:", ics)
-    print()
+    if verbose:
+        buf.append(f"ODE: {ode}")
+        buf.append(f"Initial conditions: {ics}")
+        buf.append("")
 
     # Try to solve exactly
     try:
-        exact_solution = dsolve(ode, y(x), ics=ics)
-        print("Exact solution:", exact_solution)
+        exact_solution = dsolve(ode, YX, ics=ics)
         y_exact = exact_solution.rhs
 
         # Get series expansion
         taylor_series = series(y_exact, x, 0, 6)
-        print("Taylor series:", taylor_series)
-        print("Series polynomial:", taylor_series.removeO())
+        if verbose:
+            buf.append(f"Exact solution: {exact_solution}")
+            buf.append(f"Taylor series: {taylor_series}")
+            buf.append(f"Series polynomial: {taylor_series.removeO()}")
 
     except Exception as e:
-        print("Cannot solve exactly:", e)
-        print("Using manual derivative calculation...")
-
-        # Manual calculation
-        print("\nManual calculation of derivatives at x=0:")
-        print("y(0) = 1")
-        print("y'(0) = 0")
-        print("y''(0) = 0")
-        print("y'''(0) = 0 + y(0) = 1")
-        print("y^(4)(0) = d/dx[x + y]|_{x=0} = 1 + y'(0) = 1")
-        print("y^(5)(0) = d/dx[1 + y']|_{x=0} = 0 + y''(0) = 0")
-        print("y^(6)(0) = d/dx[y'']|_{x=0} = y'''(0) = 1")
-        print()
+        if verbose:
+            buf.append(f"Cannot solve exactly: {e}")
+            buf.append("Using manual derivative calculation...")
+
+            # Manual calculation
+            buf.append("\nManual calculation of derivatives at x=0:")
+            buf.append("y(0) = 1")
+            buf.append("y'(0) = 0")
+            buf.append("y''(0) = 0")
+            buf.append("y'''(0) = 0 + y(0) = 1")
+            buf.append("y^(4)(0) = d/dx[x + y]|_{x=0} = 1 + y'(0) = 1")
+            buf.append("y^(5)(0) = d/dx[1 + y']|_{x=0} = 0 + y''(0) = 0")
+            buf.append("y^(6)(0) = d/dx[y'']|_{x=0} = y'''(0) = 1")
+            buf.append("")
 
         # Construct series manually
         coeffs = [1, 0, 0, 1, 1, 0, 1]  # y(0) through y^(6)(0)
 
-        print("Taylor series construction:")
-        terms = []
-        for i, coeff in enumerate(coeffs):
-            if coeff != 0:
-                if i == 0:
-                    terms.append(f"{coeff}")
-                elif i == 1:
-                    terms.append(f"{coeff}*x")
-                else:
-                    terms.append(f"{coeff}*x^{i}/{factorial(i)}")
-
-        print("y(x) = " + " + ".join(terms))
-
-        # Simplify the polynomial up to order 5
-        polynomial = sum(coeffs[i] * x**i / factorial(i) for i in range(6))
-        polynomial = sp.expand(polynomial)
-        print("Polynomial (up to x^5):", polynomial)
-
-        # Extract non-zero terms up to x^5
-        terms_up_to_5 = []
-        for i in range(6):
-            coeff = polynomial.coeff(x, i)
-            if coeff is not None and coeff != 0:
-                terms_up_to_5.append(f"x^{i}: {coeff}")
-
-        print("Non-zero coefficients (up to x^5):", ", ".join(terms_up_to_5))
+        if verbose:
+            buf.append("Taylor series construction:")
+            terms = []
+            for i, coeff in enumerate(coeffs):
+                if coeff != 0:
+                    if i == 0:
+                        terms.append(f"{coeff}")
+                    elif i == 1:
+                        terms.append(f"{coeff}*x")
+                    else:
+                        terms.append(f"{coeff}*x^{i}/{factorial(i)}")
+
+            buf.append("y(x) = " + " + ".join(terms))
+
+        # Build the polynomial up to order 5 straight from its coefficients
+        fact = [1]
+        for k in range(1, 6):
+            fact.append(fact[-1] * k)
+        polynomial = sp.Poly.from_dict(
+            {(i,): sp.Rational(coeffs[i], fact[i]) for i in range(6)}, x, domain="QQ"
+        ).as_expr()
+
+        if verbose:
+            buf.append(f"Polynomial (up to x^5): {polynomial}")
+
+            # Extract non-zero terms up to x^5
+            terms_up_to_5 = []
+            for i in range(6):
+                coeff = polynomial.coeff(x, i)
+                if coeff is not None and coeff != 0:
+                    terms_up_to_5.append(f"x^{i}: {coeff}")
+
+            buf.append(
+                "Non-zero coefficients (up to x^5): " + ", ".join(terms_up_to_5)
+            )
 
         return polynomial
 
+    finally:
+        if buf:
+            print("\n".join(buf))
 
-if __name__ == "__main__":
-    result = verify_third_order_coupling()
+
+def main(quiet=False):
+    """Verify the third-order case and print the conclusion"""
+    result = verify_third_order_coupling(verbose=not quiet)
 
     print("\n" + "=" * 60)
     print("CONCLUSION:")
@@ -92,3 +121,16 @@ if __name__ == "__main__":
     print("Library result should be: 1 + x^3/6 + x^4/24")
     print("Test expectation x^5/120 + ... is WRONG")
     print("=" * 60)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument(
+        "--quiet",
+        action="store_true",
+        help="skip the detailed report and print only the conclusion",
+    )
+    args = parser.parse_args()
+    sys.stdout.reconfigure(line_buffering=False)
+
+    main(quiet=args.quiet)
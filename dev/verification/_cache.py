@@ -0,0 +1,63 @@
+"""
+Small on-disk cache for sympy_crosscheck_all.py.
+
+Values are strings (srepr of SymPy results) stored in a shelve under
+~/.cache, so warm runs can skip the SymPy work entirely. Access is serialized
+with an advisory lock where the platform provides fcntl; any cache error
+is treated as a miss, so a broken cache never breaks a run.
+
+The cache is opt-in: it is only read and written when
+MAXIMA_ASYMPTOTICS_CACHE=1 is set, so by default every run recomputes.
+"""
+
+import contextlib
+import os
+import shelve
+from pathlib import Path
+from typing import Optional
+
+try:
+    import fcntl
+except ImportError:  # Windows: no advisory locks, accesses are not serialized
+    fcntl = None
+
+CACHE_PATH = Path.home() / ".cache" / "maxima-asymptotics-taylor.shelve"
+_LOCK_PATH = CACHE_PATH.with_name(CACHE_PATH.name + ".lock")
+
+
+def _enabled() -> bool:
+    return os.environ.get("MAXIMA_ASYMPTOTICS_CACHE", "0") not in ("", "0")
+
+
+@contextlib.contextmanager
+def _locked(exclusive: bool):
+    CACHE_PATH.parent.mkdir(parents=True, exist_ok=True)
+    with open(_LOCK_PATH, "a") as lock:
+        if fcntl is not None:
+            fcntl.flock(lock, fcntl.LOCK_EX if exclusive else fcntl.LOCK_SH)
+        try:
+            yield
+        finally:
+            if fcntl is not None:
+                fcntl.flock(lock, fcntl.LOCK_UN)
+
+
+def get(key: str) -> Optional[str]:
+    """Stored value for key, or None on a miss."""
+    if not _enabled():
+        return None
+    try:
+        with _locked(exclusive=False), shelve.open(str(CACHE_PATH), "r") as db:
+            return db.get(key)
+    except Exception:
+        return None
+
+
+def put(key: str, value: str) -> None:
+    if not _enabled():
+        return
+    try:
+        with _locked(exclusive=True), shelve.open(str(CACHE_PATH), "c") as db:
+            db[key] = value
+    except Exception:
+        pass
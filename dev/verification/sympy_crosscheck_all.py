@@ -18,10 +18,24 @@ Run:
     python3 sympy_crosscheck_all.py
 """
 
+import concurrent.futures
+import contextlib
+import hashlib
+import signal
+import sys
+import types
 from dataclasses import dataclass
-from typing import Dict, List, Optional, Sequence, Tuple, Union
+from fractions import Fraction
+from functools import cached_property, lru_cache, wraps
+from pathlib import Path
+from typing import Callable, Dict, List, Optional, Sequence, Tuple, Union
 import sympy as sp
 
+# _cache.py sits next to this file; make it importable from any working directory
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+
+import _cache
+
 # ----------------------------------------------------------------------------
 # Utilities
 # ----------------------------------------------------------------------------
@@ -29,13 +43,136 @@ import sympy as sp
 x = sp.Symbol("x")
 I = sp.I  # imaginary unit
 
+# Built once and shared by every solver and case
+_t = sp.Symbol("t")  # series variable, x = x0 + t
+_y = sp.Symbol("y")  # plain-symbol stand-in for y(x)
+_Y = sp.Function("y")
+_y_of_x = _Y(x)
+_F = sp.Function("f")
+_G = sp.Function("g")
+_f_of_x = _F(x)
+_g_of_x = _G(x)
+
 
 def poly_to_maxima_str(expr: sp.Expr, var: sp.Symbol = x) -> str:
     """Pretty-print a polynomial/series for easy copy into Maxima (use '^')."""
-    s = sp.simplify(sp.expand(expr))
+    s = sp.expand(expr)
     return str(s).replace("**", "^")
 
 
+def _frozen_ics(ics: Dict) -> Tuple[Tuple[str, str], ...]:
+    """Order-independent, hashable form of an initial-condition dict."""
+    return tuple(sorted((sp.srepr(k), sp.srepr(v)) for k, v in ics.items()))
+
+
+# Disk-cached results are only valid for this exact file and SymPy version
+_CACHE_VERSION = "{}-{}".format(
+    hashlib.sha1(Path(__file__).read_bytes()).hexdigest()[:12], sp.__version__
+)
+
+
+def _disk_cached(fn):
+    """Memoize fn across runs on the srepr of its arguments (see _cache.py)."""
+
+    @wraps(fn)
+    def wrapper(*args, **kwargs):
+        parts = [_CACHE_VERSION, fn.__name__]
+        parts += [_key_part(a) for a in args]
+        parts += [f"{k}={_key_part(v)}" for k, v in sorted(kwargs.items())]
+        key = repr(parts)
+        hit = _cache.get(key)
+        if hit is not None:
+            return sp.sympify(hit)
+        result = fn(*args, **kwargs)
+        # None marks a failure or timeout that may not recur; never persist it
+        if result is not None:
+            _cache.put(key, sp.srepr(result))
+        return result
+
+    return wrapper
+
+
+def _key_part(arg) -> str:
+    if isinstance(arg, dict):
+        return repr(_frozen_ics(arg))
+    if isinstance(arg, types.FunctionType):  # e.g. a _normalizer override
+        return f"{arg.__module__}.{arg.__qualname__}"
+    return sp.srepr(arg)
+
+
+@lru_cache(maxsize=None)
+def _dsolve_cached(ode_srepr: str, func_srepr: str, ics_key: Tuple[Tuple[str, str], ...]):
+    """sp.dsolve memoized on srepr keys; exceptions are not cached."""
+    ics = {sp.sympify(k): sp.sympify(v) for k, v in ics_key}
+    return sp.dsolve(sp.sympify(ode_srepr), sp.sympify(func_srepr), ics=ics)
+
+
+@lru_cache(maxsize=None)
+def _series_cached(expr_srepr: str, x0_srepr: str, order: int) -> sp.Expr:
+    """Expanded Taylor polynomial of an expression about x0, memoized on srepr keys."""
+    expr = sp.expand(sp.sympify(expr_srepr))
+    ser = sp.series(expr, x, sp.sympify(x0_srepr), order + 1).removeO()
+    return sp.expand(ser)
+
+
+# dsolve results containing these are slow (or impossible) to series-expand;
+# the recurrence is used for them instead
+_SLOW_SERIES_HEADS = (sp.Piecewise, sp.Integral, sp.Sum, sp.Heaviside, sp.DiracDelta)
+
+# Seconds allowed for one sp.series call on an exact solution
+_SERIES_TIMEOUT = 2
+
+
+@contextlib.contextmanager
+def _time_limit(seconds: int):
+    """
+    Raise TimeoutError if the block runs longer than seconds.
+
+    Relies on SIGALRM, so it is a no-op on Windows and outside the main thread.
+    """
+    if not hasattr(signal, "SIGALRM"):
+        yield
+        return
+
+    def _expired(signum, frame):
+        raise TimeoutError
+
+    try:
+        previous = signal.signal(signal.SIGALRM, _expired)
+    except ValueError:  # not the main thread
+        yield
+        return
+    signal.alarm(seconds)
+    try:
+        yield
+    finally:
+        signal.alarm(0)
+        signal.signal(signal.SIGALRM, previous)
+
+
+@lru_cache(maxsize=None)
+def _series_from_exact_cached(
+    ode_srepr: str,
+    func_srepr: str,
+    ics_key: Tuple[Tuple[str, str], ...],
+    order: int,
+    x0_srepr: str,
+):
+    try:
+        sol = _dsolve_cached(ode_srepr, func_srepr, ics_key)
+        sols = sol if isinstance(sol, list) else [sol]
+        if any(s.rhs.has(*_SLOW_SERIES_HEADS) for s in sols):
+            return None
+        with _time_limit(_SERIES_TIMEOUT):
+            got = [_series_cached(sp.srepr(s.rhs), x0_srepr, order) for s in sols]
+        return tuple(got) if isinstance(sol, list) else got[0]
+    except TimeoutError:  # depends on machine load: let the caller decide, uncached
+        raise
+    except Exception:
+        return None
+
+
+@_disk_cached
 def series_from_exact(
     ode: Union[sp.Eq, Sequence[sp.Eq]], func, ics: Dict, order: int, x0=0
 ) -> Optional[sp.Expr]:
@@ -49,20 +186,24 @@ def series_from_exact(
     Returns:
         For scalar ODEs: sp.Expr polynomial in (x-x0)
         For systems: List[sp.Expr] polynomials in (x-x0)
+
+    Returns None (so callers fall back to the recurrence) when dsolve fails,
+    when its solution holds Piecewise/Integral/Sum/Heaviside/DiracDelta, or
+    when sp.series exceeds _SERIES_TIMEOUT seconds (Unix only).
+
+    Results (including failures, but not timeouts) are memoized in-process
+    on the srepr of the inputs, so cases sharing an ODE and ICs, or an exact
+    solution, are solved once; only successes are kept on disk.
     """
     try:
-        sol = sp.dsolve(ode, func, ics=ics)
-        if isinstance(sol, list):
-            polynomials = []
-            for s in sol:
-                ser = sp.series(sp.expand(s.rhs), x, x0, order + 1).removeO()
-                polynomials.append(sp.expand(ser))
-            return polynomials  # type: ignore
-        else:
-            ser = sp.series(sp.expand(sol.rhs), x, x0, order + 1).removeO()
-            return sp.expand(ser)
-    except Exception:
+        got = _series_from_exact_cached(
+            sp.srepr(ode), sp.srepr(func), _frozen_ics(ics), order, sp.srepr(sp.sympify(x0))
+        )
+    except TimeoutError:
         return None
+    if isinstance(got, tuple):
+        return list(got)  # type: ignore
+    return got
 
 
 # ----------------------------------------------------------------------------
@@ -70,72 +211,287 @@ def series_from_exact(
 # ----------------------------------------------------------------------------
 
 
-def series_first_order(F: sp.Expr, y0: sp.Expr, order: int, x0: sp.Expr = 0) -> sp.Expr:
+def _poly_in_dx(a: Sequence[Optional[sp.Expr]], x0: sp.Expr = 0) -> sp.Expr:
+    """
+    Expanded sum of a[k] * (x - x0)^k, built directly in x (no t -> x - x0
+    substitution); None and zero coefficients are skipped.
+    """
+    dx = x - x0 if x0 != 0 else x
+    return sp.expand(sp.Add(*[c * dx**k for k, c in enumerate(a) if c is not None and c != 0]))
+
+
+@lru_cache(maxsize=None)
+def taylor_coeffs(expr: sp.Expr, order: int, x0: sp.Expr = 0) -> Tuple[sp.Expr, ...]:
+    """Taylor coefficients (c_0, ..., c_order) of expr(x0 + t) in t (memoized)."""
+    t = _t
+    shifted = sp.sympify(expr).subs(x, x0 + t)
+    if not shifted.is_polynomial(t):
+        shifted = sp.series(shifted, t, 0, order + 1).removeO()
+    p = sp.Poly(shifted, t)
+    return tuple(p.nth(k) for k in range(order + 1))
+
+
+def _coeff_of_t(expr: sp.Expr, t: sp.Symbol, n: int) -> sp.Expr:
+    """
+    Coefficient of t^n in expr, read from a Poly (no Add walk); expr is only
+    series-expanded when it is not already polynomial in t.
+    """
+    if not expr.is_polynomial(t):
+        expr = sp.series(expr, t, 0, n + 1).removeO()
+    try:
+        return sp.Poly(expr, t).nth(n)
+    except sp.PolynomialError:  # e.g. fractional powers of t left by series
+        return sp.expand(expr).coeff(t, n)
+
+
+def _poly_in_unknowns(
+    R: sp.Expr, unknowns: Sequence[sp.Expr], order: Optional[int], x0: sp.Expr = 0
+) -> Optional[List[Tuple[Tuple[int, ...], Tuple[sp.Expr, ...]]]]:
+    """
+    Split R = sum q(x) * u_k1 * u_k2 * ... over monomials in the unknowns.
+
+    Returns [(factors, taylor_coeffs(q)), ...] where factors lists the index of
+    every factor, or None when R is not polynomial in the unknowns. With
+    order=None, q itself is returned in place of its Taylor coefficients.
+    """
+    u = sp.symbols(f"u0:{len(unknowns)}")
+    # xreplace matches whole Derivative nodes before descending into y(x)
+    Ru = sp.sympify(R).xreplace(dict(zip(unknowns, u)))
+    if any(Ru.has(k) for k in unknowns):
+        return None
+    try:
+        P = sp.Poly(Ru, *u)
+    except sp.PolynomialError:
+        return None
+    return [
+        (
+            tuple(k for k in range(len(u)) for _ in range(e[k])),
+            q if order is None else taylor_coeffs(q, order, x0),
+        )
+        for e, q in P.terms()
+    ]
+
+
+def _lower_to_domain(term_lists: Sequence[List], values: Sequence[sp.Expr]):
+    """
+    Convert the Taylor coefficients of every term list, plus the initial values,
+    into elements of one exact field K (QQ, QQ_I, QQ(exp(-2)), ...).
+
+    Returns (K, lowered term lists, lowered values).
+    """
+    flat = [c for terms in term_lists for _, q in terms for c in q] + list(values)
+    K, elems = sp.construct_domain(flat, field=True)
+    it = iter(elems)
+    lowered = [[(factors, [next(it) for _ in q]) for factors, q in terms] for terms in term_lists]
+    return K, lowered, list(it)
+
+
+def _product_table(term_lists: Sequence[List], order: int, K) -> Tuple[Dict, List]:
+    """
+    Empty coefficient lists for every product of unknowns the terms need.
+
+    Every prefix of a monomial is kept, so longer products extend shorter ones;
+    the returned keys are sorted so prefixes come first.
+    """
+    prods = {(): [K.one] + [K.zero] * order}
+    for terms in term_lists:
+        for factors, _ in terms:
+            for r in range(1, len(factors) + 1):
+                prods.setdefault(factors[:r], [])
+    return prods, sorted((key for key in prods if key), key=len)
+
+
+def _extend_products(prods: Dict, keys: List, series: Sequence[List], n: int, K) -> None:
+    """Append the t^n coefficient of every product; needs series[k][0..n]."""
+    for key in keys:
+        prev, fac = prods[key[:-1]], series[key[-1]]
+        prods[key].append(sum((prev[j] * fac[n - j] for j in range(n + 1)), K.zero))
+
+
+def _rhs_coeff(terms: List, prods: Dict, n: int, K):
+    """t^n coefficient of sum q(t) * product, as a Cauchy product."""
+    return sum(
+        (q[j] * prods[factors][n - j] for factors, q in terms for j in range(n + 1)), K.zero
+    )
+
+
+@_disk_cached
+def series_first_order(
+    F: sp.Expr,
+    y0: sp.Expr,
+    order: int,
+    x0: sp.Expr = 0,
+    _normalizer: Callable[[sp.Expr], sp.Expr] = sp.cancel,
+) -> sp.Expr:
     """
     Compute series for y' = F(x, y), y(x0) = y0 up to 'order' in (x-x0).
     Returns a polynomial in (x-x0).
+    _normalizer puts each new coefficient in normal form; sp.cancel is exact
+    and cheap for the rational (or Gaussian-rational) coefficients used here.
     """
-    t = sp.Symbol("t")
     # We'll expand around t = 0 where x = x0 + t
     # y(t) = sum_{k=0..order} a_k t^k
     a = [None] * (order + 1)  # coefficients
     a[0] = sp.sympify(y0)
 
+    terms = _poly_in_unknowns(sp.sympify(F).xreplace({_y: _y_of_x}), [_y_of_x], order, x0)
+    if terms is not None:
+        # F polynomial in y: the t^n coefficient of F(x0+t, y(t)) is a Cauchy
+        # product of the Taylor coefficients of the p_i(x) with those of y^i,
+        # and a[n+1] = f_n/(n+1). The recurrence runs on exact domain elements
+        # instead of sp.Expr trees; only the results are converted back.
+        K, (terms,), (b0,) = _lower_to_domain([terms], [a[0]])
+        b = [b0]
+        prods, keys = _product_table([terms], order, K)
+        for n in range(order):
+            _extend_products(prods, keys, [b], n, K)
+            b.append(K.quo(_rhs_coeff(terms, prods, n, K), K.convert(n + 1)))
+        a = [_normalizer(K.to_sympy(c)) for c in b]
+    else:
+        a = _series_first_order_generic(F, a, order, x0, _normalizer)
+
+    return _poly_in_dx(a, x0)
+
+
+def _series_first_order_generic(
+    F: sp.Expr, a: List, order: int, x0: sp.Expr, normalizer: Callable
+) -> List:
+    """Fill a[1..order] by re-expanding F(x0+t, y(t)) with sp.series each step."""
+    t = _t
     for n in range(order):  # we can determine a[n+1]
-        Yn = sum((a[k] if a[k] is not None else 0) * t**k for k in range(n + 1))
+        Yn = sp.Add(*[a[k] * t**k for k in range(n + 1) if a[k] != 0])
         F_sub = sp.expand(
-            F.subs({x: x0 + t, sp.Function("y")(x): Yn, sp.Symbol("y"): Yn})
+            F.subs({x: x0 + t, _y_of_x: Yn, _y: Yn})
         )
-        F_ser = sp.series(F_sub, t, 0, n + 1).removeO()
-        c_n = sp.expand(F_ser).coeff(t, n)  # coefficient of t^n in RHS
-        a[n + 1] = sp.simplify(c_n / (n + 1))
+        c_n = _coeff_of_t(F_sub, t, n)  # coefficient of t^n in RHS
+        a[n + 1] = normalizer(c_n / (n + 1))
+    return a
 
-    poly_t = sum((a[k] if a[k] is not None else 0) * t**k for k in range(order + 1))
-    return sp.expand(poly_t.subs(t, x - x0))
 
+def _factorial_table(n: int) -> List[sp.Integer]:
+    """[0!, 1!, ..., n!] as sp.Integer, built by running products."""
+    fact = [sp.Integer(1)]
+    for k in range(1, n + 1):
+        fact.append(fact[-1] * k)
+    return fact
 
+
+@_disk_cached
 def series_nth_order(
-    m: int, G: sp.Expr, ics: Dict[int, sp.Expr], order: int, x0: sp.Expr = 0
+    m: int,
+    G: sp.Expr,
+    ics: Dict[int, sp.Expr],
+    order: int,
+    x0: sp.Expr = 0,
+    _normalizer: Callable[[sp.Expr], sp.Expr] = sp.cancel,
 ) -> sp.Expr:
     """
     Compute series for y^(m) = G(x, y, y', ..., y^(m-1)) about x0 up to 'order'.
     ics: maps derivative order k (0..m-1) to y^(k)(x0).
     Returns polynomial in (x-x0).
+    _normalizer is applied to each new coefficient (see series_first_order).
     """
-    t = sp.Symbol("t")
-    # y(t) = sum_{k=0..order} a_k t^k
+    fact = _factorial_table(max(order, m))
+    # y(t) = sum_{k=0..order} a_k t^k, with a_k = y^(k)(x0)/k!
     a = [sp.S(0)] * (order + 1)
     for k, val in ics.items():
-        a[k] = sp.sympify(val)
+        a[k] = sp.sympify(val) / fact[k]
+
+    G = sp.sympify(G).xreplace({_y: _y_of_x})
+    y_derivs = [_y_of_x.diff(x, k) for k in range(m)]
+    terms = _poly_in_unknowns(G, y_derivs, order, x0)
+    if terms is not None:
+        # D[k][j] is the t^j coefficient of y^(k)(t) = (j+k)!/j! * a[j+k]; it is
+        # known for j <= n once a[0..n+m-1] are. All arithmetic is on elements
+        # of one exact domain K (see _lower_to_domain).
+        K, (terms,), b = _lower_to_domain([terms], a)
+        D = [[] for _ in range(m)]
+        prods, keys = _product_table([terms], order, K)
+        for n in range(order - m + 1):
+            for k in range(m):
+                D[k].append(K.convert(fact[n + k] / fact[n]) * b[n + k])
+            _extend_products(prods, keys, D, n, K)
+            c_n = _rhs_coeff(terms, prods, n, K)
+            # Coefficient of t^n in y^(m) is a_{n+m} * (n+m)!/n!
+            b[n + m] = K.quo(c_n, K.convert(fact[n + m] / fact[n]))
+        a = [_normalizer(K.to_sympy(c)) for c in b]
+    else:
+        _series_nth_order_generic(m, G, a, order, x0, _normalizer, fact)
+
+    return _poly_in_dx(a, x0)
+
+
+def _series_nth_order_generic(
+    m: int,
+    G: sp.Expr,
+    a: List[sp.Expr],
+    order: int,
+    x0: sp.Expr,
+    normalizer: Callable,
+    fact: List[sp.Integer],
+) -> None:
+    """
+    Fill a[m..order] by re-expanding G with sp.series each step; fact[k] = k!.
+    """
+    t = _t
 
     # Helper to build truncated y and its derivatives using currently known a's
     def Y_upto(K: int):
-        return sum(a[i] * t**i for i in range(min(K, order) + 1))
+        return sp.Add(*[a[i] * t**i for i in range(min(K, order) + 1) if a[i] != 0])
 
+    # The substitution keys are the same every step; only the values change
+    y_derivs = [_y_of_x.diff(x, k) for k in range(m)]
+    subs_map = {x: x0 + t, _y: None, **{key: None for key in y_derivs}}
     for n in range(order - m + 1):
         # Build y, y', ..., y^(m-1) using known coefficients up to index n+m-1
         Y = Y_upto(n + m - 1)
-        derivs = [sp.diff(Y, t, k) for k in range(m)]
         # Left side y^(m)
         # Right side G(x, y, y', ..., y^(m-1))
-        subs_map = {x: x0 + t, sp.Function("y")(x): Y, sp.Symbol("y"): Y}
-        for k in range(1, m):
-            subs_map[sp.Function("y")(x).diff(x, k - 1)] = derivs[k - 1]
+        subs_map[_y] = Y
+        for k, key in enumerate(y_derivs):
+            subs_map[key] = sp.diff(Y, t, k)
 
         G_sub = sp.expand(G.subs(subs_map))
-        G_ser = sp.series(G_sub, t, 0, n + 1).removeO()
-        c_n = sp.expand(G_ser).coeff(t, n)  # RHS coeff of t^n
+        c_n = _coeff_of_t(G_sub, t, n)  # RHS coeff of t^n
 
         # Coefficient of t^n in y^(m) is a_{n+m} * (n+m)!/n!
-        factor = sp.factorial(n + m) / sp.factorial(n)
-        a[n + m] = sp.simplify(c_n / factor)
+        a[n + m] = normalizer(c_n * fact[n] / fact[n + m])
 
-    poly_t = sum(a[k] * t**k for k in range(order + 1))
-    return sp.expand(poly_t.subs(t, x - x0))
 
+def _is_free_of_y(R) -> bool:
+    """True when a right-hand side does not involve y(x) or its derivatives."""
+    R = sp.sympify(R)
+    return not (R.has(_y_of_x) or R.has(_y))
 
+
+def series_by_quadrature(
+    m: int, R: sp.Expr, ics: Dict[int, sp.Expr], order: int, x0: sp.Expr = 0
+) -> sp.Expr:
+    """
+    Series for y^(m) = R(x) about x0 up to 'order': the Taylor coefficients of R
+    integrated m times, plus the polynomial fixed by ics = {k: y^(k)(x0)}.
+    """
+    fact = _factorial_table(max(order, m))
+    a = [sp.S(0)] * (order + 1)
+    for k, val in ics.items():
+        if k <= order:
+            a[k] = sp.sympify(val) / fact[k]
+    if order >= m:
+        c = taylor_coeffs(R, order - m, x0)
+        for j in range(order - m + 1):
+            a[j + m] = c[j] * fact[j] / fact[j + m]
+    return _poly_in_dx(a, x0)
+
+
+@_disk_cached
 def series_system_2x2(
-    F: sp.Expr, G: sp.Expr, f0: sp.Expr, g0: sp.Expr, order: int, x0: sp.Expr = 0
+    F: sp.Expr,
+    G: sp.Expr,
+    f0: sp.Expr,
+    g0: sp.Expr,
+    order: int,
+    x0: sp.Expr = 0,
+    _normalizer: Callable[[sp.Expr], sp.Expr] = sp.cancel,
 ) -> Tuple[sp.Expr, sp.Expr]:
     """
     Compute series for the system:
@@ -143,42 +499,116 @@ def series_system_2x2(
         g' = G(x, f, g)
     with f(x0)=f0, g(x0)=g0 up to 'order' in (x-x0).
     Returns (f_poly, g_poly).
+    _normalizer is applied to each new coefficient (see series_first_order).
     """
-    t = sp.Symbol("t")
+    t = _t
     af = [None] * (order + 1)
     ag = [None] * (order + 1)
     af[0] = sp.sympify(f0)
     ag[0] = sp.sympify(g0)
 
+    fg = [_f_of_x, _g_of_x]
+    terms_F = _poly_in_unknowns(F, fg, order, x0)
+    terms_G = _poly_in_unknowns(G, fg, order, x0)
+    if terms_F is not None and terms_G is not None:
+        # Both right-hand sides polynomial in f and g: share one product table
+        # and run the Cauchy-product recurrence on exact domain elements.
+        K, (terms_F, terms_G), (bf0, bg0) = _lower_to_domain([terms_F, terms_G], [af[0], ag[0]])
+        bf, bg = [bf0], [bg0]
+        prods, keys = _product_table([terms_F, terms_G], order, K)
+        for n in range(order):
+            _extend_products(prods, keys, [bf, bg], n, K)
+            cF = _rhs_coeff(terms_F, prods, n, K)
+            cG = _rhs_coeff(terms_G, prods, n, K)
+            bf.append(K.quo(cF, K.convert(n + 1)))
+            bg.append(K.quo(cG, K.convert(n + 1)))
+        af = [_normalizer(K.to_sympy(c)) for c in bf]
+        ag = [_normalizer(K.to_sympy(c)) for c in bg]
+        return _poly_in_dx(af, x0), _poly_in_dx(ag, x0)
+
+    # Running partial sums of f and g, extended by one term per step and
+    # shared by both right-hand sides
+    Yf, Yg = af[0], ag[0]
     for n in range(order):
-        F_sub = sp.expand(
-            F.subs(
-                {
-                    x: x0 + t,
-                    sp.Function("f")(x): sum((af[k] or 0) * t**k for k in range(n + 1)),
-                    sp.Function("g")(x): sum((ag[k] or 0) * t**k for k in range(n + 1)),
-                }
-            )
-        )
-        G_sub = sp.expand(
-            G.subs(
-                {
-                    x: x0 + t,
-                    sp.Function("f")(x): sum((af[k] or 0) * t**k for k in range(n + 1)),
-                    sp.Function("g")(x): sum((ag[k] or 0) * t**k for k in range(n + 1)),
-                }
-            )
-        )
-        F_ser = sp.series(F_sub, t, 0, n + 1).removeO()
-        G_ser = sp.series(G_sub, t, 0, n + 1).removeO()
-        cF = sp.expand(F_ser).coeff(t, n)
-        cG = sp.expand(G_ser).coeff(t, n)
-        af[n + 1] = sp.simplify(cF / (n + 1))
-        ag[n + 1] = sp.simplify(cG / (n + 1))
+        subs_map = {x: x0 + t, _f_of_x: Yf, _g_of_x: Yg}
+        cF = _coeff_of_t(sp.expand(F.subs(subs_map)), t, n)
+        cG = _coeff_of_t(sp.expand(G.subs(subs_map)), t, n)
+        af[n + 1] = _normalizer(cF / (n + 1))
+        ag[n + 1] = _normalizer(cG / (n + 1))
+        Yf += af[n + 1] * t ** (n + 1)
+        Yg += ag[n + 1] * t ** (n + 1)
+
+    return _poly_in_dx(af, x0), _poly_in_dx(ag, x0)
+
 
-    poly_f = sum((af[k] or 0) * t**k for k in range(order + 1))
-    poly_g = sum((ag[k] or 0) * t**k for k in range(order + 1))
-    return sp.expand(poly_f.subs(t, x - x0)), sp.expand(poly_g.subs(t, x - x0))
+def _linear_constant_row(R: sp.Expr, unknowns: Sequence[sp.Expr]) -> Optional[List[Fraction]]:
+    """
+    Coefficients [c_0, ...] when R = sum c_k * unknowns[k] with rational
+    constants c_k (no x, no source term), otherwise None.
+    """
+    terms = _poly_in_unknowns(R, unknowns, None)
+    if terms is None:
+        return None
+    row = [sp.S.Zero] * len(unknowns)
+    for factors, q in terms:
+        if not q.is_Rational:  # x-dependent, or e.g. I or sin(1): leave to SymPy
+            return None
+        if len(factors) == 1:
+            row[factors[0]] = q
+        elif q != 0:  # source term or nonlinear monomial
+            return None
+    return [Fraction(int(c.p), int(c.q)) for c in row]
+
+
+def _linear_constant_matrix(
+    rhs: Sequence[sp.Expr], unknowns: Sequence[sp.Expr]
+) -> Optional[List[List[Fraction]]]:
+    """A such that (unknowns)' = A @ unknowns, or None if the system is not of that form."""
+    rows = [_linear_constant_row(R, unknowns) for R in rhs]
+    return None if any(row is None for row in rows) else rows
+
+
+def series_linear_constant(
+    A: List[List[Fraction]], v0: Sequence[sp.Expr], order: int, x0: sp.Expr = 0
+) -> Optional[List[sp.Expr]]:
+    """
+    Series of v' = A v, v(x0) = v0 up to 'order' in (x-x0), one per component.
+
+    The Taylor coefficients follow v_{n+1} = A v_n / (n+1) and are computed
+    with Fraction arithmetic; SymPy is only used to build the polynomials.
+    Returns None when an initial value is not rational.
+    """
+    v0 = [sp.sympify(c) for c in v0]
+    if not all(c.is_Rational for c in v0):
+        return None
+    v = [Fraction(int(c.p), int(c.q)) for c in v0]
+    coeffs = [v]
+    for n in range(order):
+        v = [sum((a * vj for a, vj in zip(row, v)), Fraction(0)) / (n + 1) for row in A]
+        coeffs.append(v)
+    return [
+        _poly_in_dx([sp.Rational(c[i].numerator, c[i].denominator) for c in coeffs], x0)
+        for i in range(len(v0))
+    ]
+
+
+def _linear_constant_scalar(c: "ScalarCase") -> Optional[sp.Expr]:
+    """series_linear_constant for a scalar case, via companion form for y^(m)."""
+    if c.ode_type == "first":
+        A = _linear_constant_matrix([sp.sympify(c.F).xreplace({_y: _y_of_x})], [_y_of_x])
+        v0 = [c.ics_first]
+    else:
+        # State (y, y', ..., y^(m-1)): shift rows, then the row read off G
+        y_derivs = [_y_of_x.diff(x, k) for k in range(c.m)]
+        row = _linear_constant_row(sp.sympify(c.G).xreplace({_y: _y_of_x}), y_derivs)
+        if row is None:
+            return None
+        A = [[Fraction(int(j == k + 1)) for j in range(c.m)] for k in range(c.m - 1)] + [row]
+        v0 = [c.ics_nth.get(k, 0) for k in range(c.m)]
+    if A is None:
+        return None
+    got = series_linear_constant(A, v0, c.order, c.x0)
+    return None if got is None else got[0]
 
 
 # ----------------------------------------------------------------------------
@@ -200,7 +630,12 @@ class ScalarCase:
     ics_first: Optional[sp.Expr] = None  # y(x0) = ...
     ics_nth: Optional[Dict[int, sp.Expr]] = None  # {k: y^(k)(x0)}
     order: int = 5
-    expected: Optional[sp.Expr] = None  # polynomial in (x-x0)
+    # Builds the expected polynomial in (x-x0); called at most once
+    expected: Optional[Callable[[], sp.Expr]] = None
+
+    @cached_property
+    def expected_poly(self) -> Optional[sp.Expr]:
+        return None if self.expected is None else sp.sympify(self.expected())
 
 
 @dataclass
@@ -212,21 +647,31 @@ class SystemCase:
     f0: sp.Expr
     g0: sp.Expr
     order: int
-    expected_f: Optional[sp.Expr]
-    expected_g: Optional[sp.Expr]
+    # Build the expected polynomials for f and g; each is called at most once
+    expected_f: Optional[Callable[[], sp.Expr]]
+    expected_g: Optional[Callable[[], sp.Expr]]
+
+    @cached_property
+    def expected_f_poly(self) -> Optional[sp.Expr]:
+        return None if self.expected_f is None else sp.sympify(self.expected_f())
 
+    @cached_property
+    def expected_g_poly(self) -> Optional[sp.Expr]:
+        return None if self.expected_g is None else sp.sympify(self.expected_g())
 
+
+@lru_cache(maxsize=1)
 def build_cases() -> Tuple[List[ScalarCase], List[SystemCase]]:
     # Phase 1: Basic first-order
     P1_basic = [
         ScalarCase(
             "Linear homogeneous y'=y",
             "first",
-            F=sp.Function("y")(x),
+            F=_y_of_x,
             x0=0,
             ics_first=1,
             order=6,
-            expected=1
+            expected=lambda: 1
             + x
             + x**2 / sp.Integer(2)
             + x**3 / sp.Integer(6)
@@ -237,11 +682,11 @@ def build_cases() -> Tuple[List[ScalarCase], List[SystemCase]]:
         ScalarCase(
             "Linear y'=2y",
             "first",
-            F=2 * sp.Function("y")(x),
+            F=2 * _y_of_x,
             x0=0,
             ics_first=3,
             order=4,
-            expected=3 + 6 * x + 6 * x**2 + 4 * x**3 + 2 * x**4,
+            expected=lambda: 3 + 6 * x + 6 * x**2 + 4 * x**3 + 2 * x**4,
         ),
         ScalarCase(
             "Polynomial source y'=x^2",
@@ -250,7 +695,7 @@ def build_cases() -> Tuple[List[ScalarCase], List[SystemCase]]:
             x0=0,
             ics_first=0,
             order=5,
-            expected=x**3 / 3,
+            expected=lambda: x**3 / 3,
         ),
         ScalarCase(
             "Mixed polynomial y'=x+x^2",
@@ -259,16 +704,16 @@ def build_cases() -> Tuple[List[ScalarCase], List[SystemCase]]:
             x0=0,
             ics_first=1,
             order=4,
-            expected=1 + x**2 / 2 + x**3 / 3,
+            expected=lambda: 1 + x**2 / 2 + x**3 / 3,
         ),
         ScalarCase(
             "Separable y'=y^2",
             "first",
-            F=sp.Function("y")(x) ** 2,
+            F=_y_of_x ** 2,
             x0=0,
             ics_first=1,
             order=5,
-            expected=1 + x + x**2 + x**3 + x**4 + x**5,
+            expected=lambda: 1 + x + x**2 + x**3 + x**4 + x**5,
         ),
     ]
 
@@ -277,29 +722,29 @@ def build_cases() -> Tuple[List[ScalarCase], List[SystemCase]]:
         ScalarCase(
             "Bernoulli y'=xy",
             "first",
-            F=x * sp.Function("y")(x),
+            F=x * _y_of_x,
             x0=0,
             ics_first=1,
             order=6,
-            expected=1 + x**2 / 2 + x**4 / 8 + x**6 / 48,
+            expected=lambda: 1 + x**2 / 2 + x**4 / 8 + x**6 / 48,
         ),
         ScalarCase(
             "Linear inhomo y'=y+sin(x)",
             "first",
-            F=sp.Function("y")(x) + sp.sin(x),
+            F=_y_of_x + sp.sin(x),
             x0=0,
             ics_first=0,
             order=5,
-            expected=x**2 / 2 + x**3 / 6,
+            expected=lambda: x**2 / 2 + x**3 / 6,
         ),
         ScalarCase(
             "Riccati y'=1+y^2",
             "first",
-            F=1 + sp.Function("y")(x) ** 2,
+            F=1 + _y_of_x ** 2,
             x0=0,
             ics_first=0,
             order=5,
-            expected=x + x**3 / 3 + 2 * x**5 / 15,
+            expected=lambda: x + x**3 / 3 + 2 * x**5 / 15,
         ),
     ]
 
@@ -313,16 +758,16 @@ def build_cases() -> Tuple[List[ScalarCase], List[SystemCase]]:
             x0=1,
             ics_first=2,
             order=4,
-            expected=2 + t + t**2 + t**3 / sp.Integer(3),
+            expected=lambda: 2 + t + t**2 + t**3 / sp.Integer(3),
         ),
         ScalarCase(
             "Exponential at x=2",
             "first",
-            F=sp.Function("y")(x),
+            F=_y_of_x,
             x0=2,
             ics_first=1,
             order=4,
-            expected=1
+            expected=lambda: 1
             + (x - 2)
             + (x - 2) ** 2 / 2
             + (x - 2) ** 3 / 6
@@ -335,7 +780,7 @@ def build_cases() -> Tuple[List[ScalarCase], List[SystemCase]]:
             x0=-1,
             ics_first=0,
             order=3,
-            expected=-2 * (x + 1) + (x + 1) ** 2,
+            expected=lambda: -2 * (x + 1) + (x + 1) ** 2,
         ),
     ]
 
@@ -344,24 +789,32 @@ def build_cases() -> Tuple[List[ScalarCase], List[SystemCase]]:
         ScalarCase(
             "Order 0",
             "first",
-            F=x + sp.Function("y")(x) ** 2,
+            F=x + _y_of_x ** 2,
             x0=0,
             ics_first=5,
             order=0,
-            expected=5,
+            expected=lambda: 5,
+        ),
+        ScalarCase(
+            "Order 1", "first", F=3 * x, x0=0, ics_first=2, order=1, expected=lambda: 2
         ),
-        ScalarCase("Order 1", "first", F=3 * x, x0=0, ics_first=2, order=1, expected=2),
         ScalarCase(
-            "Constant RHS", "first", F=5, x0=0, ics_first=1, order=3, expected=1 + 5 * x
+            "Constant RHS",
+            "first",
+            F=5,
+            x0=0,
+            ics_first=1,
+            order=3,
+            expected=lambda: 1 + 5 * x,
         ),
         ScalarCase(
             "Complex coefficient",
             "first",
-            F=I * sp.Function("y")(x),
+            F=I * _y_of_x,
             x0=0,
             ics_first=1,
             order=3,
-            expected=1 + I * x + (I**2) * x**2 / 2 + (I**3) * x**3 / 6,
+            expected=lambda: 1 + I * x + (I**2) * x**2 / 2 + (I**3) * x**3 / 6,
         ),
     ]
 
@@ -371,41 +824,41 @@ def build_cases() -> Tuple[List[ScalarCase], List[SystemCase]]:
             "Hyperbolic cosine (y''=y)",
             "nth",
             m=2,
-            G=sp.Function("y")(x),
+            G=_y_of_x,
             x0=0,
             ics_nth={0: 1, 1: 0},
             order=6,
-            expected=1 + x**2 / 2 + x**4 / 24 + x**6 / 720,
+            expected=lambda: 1 + x**2 / 2 + x**4 / 24 + x**6 / 720,
         ),
         ScalarCase(
             "Trigonometric cosine (y''=-y)",
             "nth",
             m=2,
-            G=-sp.Function("y")(x),
+            G=-_y_of_x,
             x0=0,
             ics_nth={0: 1, 1: 0},
             order=6,
-            expected=1 - x**2 / 2 + x**4 / 24 - x**6 / 720,
+            expected=lambda: 1 - x**2 / 2 + x**4 / 24 - x**6 / 720,
         ),
         ScalarCase(
             "Trigonometric sine (y''=-y, sine IC)",
             "nth",
             m=2,
-            G=-sp.Function("y")(x),
+            G=-_y_of_x,
             x0=0,
             ics_nth={0: 0, 1: 1},
             order=5,
-            expected=x - x**3 / 6 + x**5 / 120,
+            expected=lambda: x - x**3 / 6 + x**5 / 120,
         ),
         ScalarCase(
             "SHO frequency 2 (y''=-4y)",
             "nth",
             m=2,
-            G=-4 * sp.Function("y")(x),
+            G=-4 * _y_of_x,
             x0=0,
             ics_nth={0: 1, 1: 0},
             order=4,
-            expected=1 - 2 * x**2 + 2 * x**4 / 3,
+            expected=lambda: 1 - 2 * x**2 + 2 * x**4 / 3,
         ),
         # Damped oscillator is checked numerically in Maxima - no explicit expected series
     ]
@@ -420,27 +873,27 @@ def build_cases() -> Tuple[List[ScalarCase], List[SystemCase]]:
             x0=0,
             ics_nth={0: 1, 1: 2, 2: 3},
             order=3,
-            expected=1 + 2 * x + (sp.Rational(3, 2)) * x**2,
+            expected=lambda: 1 + 2 * x + (sp.Rational(3, 2)) * x**2,
         ),
         ScalarCase(
             "Fourth order y^(4)=y",
             "nth",
             m=4,
-            G=sp.Function("y")(x),
+            G=_y_of_x,
             x0=0,
             ics_nth={0: 1, 1: 0, 2: 0, 3: 0},
             order=8,
-            expected=1 + x**4 / 24 + x**8 / 40320,
+            expected=lambda: 1 + x**4 / 24 + x**8 / 40320,
         ),
         ScalarCase(
             "Third order coupling (y'''=x+y)",
             "nth",
             m=3,
-            G=x + sp.Function("y")(x),
+            G=x + _y_of_x,
             x0=0,
             ics_nth={0: 1, 1: 0, 2: 0},
             order=5,
-            expected=1 + x**3 / 6 + x**4 / 24,
+            expected=lambda: 1 + x**3 / 6 + x**4 / 24,
         ),
     ]
 
@@ -450,11 +903,11 @@ def build_cases() -> Tuple[List[ScalarCase], List[SystemCase]]:
             "Second order at x=1 (y''=y)",
             "nth",
             m=2,
-            G=sp.Function("y")(x),
+            G=_y_of_x,
             x0=1,
             ics_nth={0: 1, 1: 1},
             order=4,
-            expected=1
+            expected=lambda: 1
             + (x - 1)
             + (x - 1) ** 2 / 2
             + (x - 1) ** 3 / 6
@@ -468,12 +921,31 @@ def build_cases() -> Tuple[List[ScalarCase], List[SystemCase]]:
             x0=2,
             ics_nth={0: 0, 1: 0, 2: 0},
             order=4,
-            expected=(x - 2) ** 3,
+            expected=lambda: (x - 2) ** 3,
+        ),
+    ]
+
+    # Right-hand sides written with the plain y placeholder instead of y(x)
+    P_placeholder = [
+        ScalarCase(
+            "Placeholder y, nonlinear (y''=x-y^2)",
+            "nth",
+            m=2,
+            G=x - _y**2,
+            x0=0,
+            ics_nth={0: 1, 1: 0},
+            order=6,
+            expected=lambda: 1
+            - x**2 / 2
+            + x**3 / 6
+            + x**4 / 12
+            - x**5 / 60
+            - x**6 / 72,
         ),
     ]
 
     # Phase 3: Systems with explicit expectations
-    f, g = sp.Function("f")(x), sp.Function("g")(x)
+    f, g = _f_of_x, _g_of_x
     P3_systems = [
         SystemCase(
             "Simple oscillator f/g",
@@ -483,8 +955,8 @@ def build_cases() -> Tuple[List[ScalarCase], List[SystemCase]]:
             f0=0,
             g0=1,
             order=5,
-            expected_f=x - x**3 / 6 + x**5 / 120,
-            expected_g=1 - x**2 / 2 + x**4 / 24,
+            expected_f=lambda: x - x**3 / 6 + x**5 / 120,
+            expected_g=lambda: 1 - x**2 / 2 + x**4 / 24,
         ),
         SystemCase(
             "Exp system f/g",
@@ -496,13 +968,13 @@ def build_cases() -> Tuple[List[ScalarCase], List[SystemCase]]:
             order=5,
             # NOTE: Maxima test currently expects x^5/15 for both f and g,
             # but the correct coefficient is 2/15.
-            expected_f=1
+            expected_f=lambda: 1
             + x
             + x**2
             + sp.Rational(2, 3) * x**3
             + sp.Rational(1, 3) * x**4
             + sp.Rational(1, 15) * x**5,
-            expected_g=x
+            expected_g=lambda: x
             + x**2
             + sp.Rational(2, 3) * x**3
             + sp.Rational(1, 3) * x**4
@@ -516,8 +988,8 @@ def build_cases() -> Tuple[List[ScalarCase], List[SystemCase]]:
             f0=0,
             g0=1,
             order=4,
-            expected_f=x**2 / 2,
-            expected_g=1 + x + x**2 / 2 + x**3 / 3 + x**4 / 12,
+            expected_f=lambda: x**2 / 2,
+            expected_g=lambda: 1 + x + x**2 / 2 + x**3 / 3 + x**4 / 12,
         ),
         SystemCase(
             "Nonlinear exact (f=0,g=1)",
@@ -527,8 +999,8 @@ def build_cases() -> Tuple[List[ScalarCase], List[SystemCase]]:
             f0=0,
             g0=1,
             order=6,
-            expected_f=0,
-            expected_g=1,
+            expected_f=lambda: 0,
+            expected_g=lambda: 1,
         ),
     ]
 
@@ -541,7 +1013,7 @@ def build_cases() -> Tuple[List[ScalarCase], List[SystemCase]]:
             x0=0,
             ics_first=0,
             order=7,
-            expected=x - x**3 / 6 + x**5 / 120 - x**7 / 5040,
+            expected=lambda: x - x**3 / 6 + x**5 / 120 - x**7 / 5040,
         ),
         # "exp" case is numeric check in Maxima, skip explicit expected
         ScalarCase(
@@ -551,7 +1023,7 @@ def build_cases() -> Tuple[List[ScalarCase], List[SystemCase]]:
             x0=0,
             ics_first=0,
             order=9,
-            expected=x - x**3 / 3 + x**5 / 5 - x**7 / 7 + x**9 / 9,
+            expected=lambda: x - x**3 / 3 + x**5 / 5 - x**7 / 7 + x**9 / 9,
         ),
         # The Maxima test labels this as "Integration gives arcsin" but sets F = sqrt(1-x^2).
         # That integrand actually yields: ∫ sqrt(1-x^2) dx = x - x^3/6 - x^5/40 + ...
@@ -562,7 +1034,7 @@ def build_cases() -> Tuple[List[ScalarCase], List[SystemCase]]:
             x0=0,
             ics_first=0,
             order=5,
-            expected=x + x**3 / 6 + sp.Rational(3, 40) * x**5,
+            expected=lambda: x + x**3 / 6 + sp.Rational(3, 40) * x**5,
         ),
     ]
 
@@ -574,6 +1046,7 @@ def build_cases() -> Tuple[List[ScalarCase], List[SystemCase]]:
         + P2_second
         + P2_higher
         + P2_nonzero
+        + P_placeholder
         + P_special
     )
     return scalar_cases, P3_systems
@@ -585,52 +1058,75 @@ def build_cases() -> Tuple[List[ScalarCase], List[SystemCase]]:
 
 
 def compare_polys(got: sp.Expr, expect: sp.Expr) -> Tuple[bool, sp.Expr]:
-    diff = sp.simplify(sp.expand(got - expect))
-    return (diff == 0), diff
+    # Both sides are polynomials in (x-x0): compare their Poly forms (dense
+    # coefficient lists; the domain, e.g. QQ_I for complex cases, is inferred)
+    try:
+        pg, pe = sp.Poly(got, x), sp.Poly(expect, x)
+    except sp.PolynomialError:  # not polynomial in x after all
+        diff = sp.expand(got - expect)
+        return (diff == 0), diff
+    return (pg == pe), (pg - pe).as_expr()
 
 
 def run_scalar_case(c: ScalarCase) -> Tuple[bool, Optional[sp.Expr], Optional[sp.Expr]]:
-    # Try exact; otherwise use series recursion
+    # Linear constant-coefficient ODEs use a Fraction recurrence; otherwise try
+    # exact, then the series recursion
     if c.ode_type == "first":
-        # If F is independent of y, direct integration via exact solve should work; but series method is general
-        got = series_from_exact(
-            sp.Eq(sp.Function("y")(x).diff(x), c.F),
-            sp.Function("y")(x),
-            {sp.Function("y")(x).subs(x, c.x0): c.ics_first},
-            c.order,
-            c.x0,
-        )
-        if got is None:
-            got = series_first_order(c.F, c.ics_first, c.order, c.x0)
+        if _is_free_of_y(c.F):
+            # y' = F(x): integrate the Taylor series of F, no dsolve needed
+            got = series_by_quadrature(1, c.F, {0: c.ics_first}, c.order, c.x0)
+        else:
+            got = _linear_constant_scalar(c)
+            if got is None:
+                got = series_from_exact(
+                    sp.Eq(_y_of_x.diff(x), sp.sympify(c.F).xreplace({_y: _y_of_x})),
+                    _y_of_x,
+                    {_y_of_x.subs(x, c.x0): c.ics_first},
+                    c.order,
+                    c.x0,
+                )
+            if got is None:
+                got = series_first_order(c.F, c.ics_first, c.order, c.x0)
     else:  # nth
         # rewrite into y'' = G etc in series form directly
         if c.m is None or c.G is None or c.ics_nth is None:
             raise ValueError(f"Malformed nth-order case: {c.label}")
-        # exact attempt
-        ode_eq = sp.Eq(sp.Function("y")(x).diff(x, c.m), c.G)
-        ics_map = {
-            sp.Function("y")(x).diff(x, k).subs(x, c.x0): v
-            for k, v in c.ics_nth.items()
-        }
-        got = series_from_exact(ode_eq, sp.Function("y")(x), ics_map, c.order, c.x0)
-        if got is None:
-            got = series_nth_order(c.m, c.G, c.ics_nth, c.order, c.x0)
-
-    if c.expected is None:
+        if _is_free_of_y(c.G):
+            # y^(m) = G(x): m-fold integration of the Taylor series of G
+            got = series_by_quadrature(c.m, c.G, c.ics_nth, c.order, c.x0)
+        else:
+            got = _linear_constant_scalar(c)
+            if got is None:
+                # exact attempt (y(x), not the y placeholder, so dsolve sees it)
+                ode_eq = sp.Eq(_y_of_x.diff(x, c.m), sp.sympify(c.G).xreplace({_y: _y_of_x}))
+                ics_map = {
+                    _y_of_x.diff(x, k).subs(x, c.x0): v
+                    for k, v in c.ics_nth.items()
+                }
+                got = series_from_exact(ode_eq, _y_of_x, ics_map, c.order, c.x0)
+            if got is None:
+                got = series_nth_order(c.m, c.G, c.ics_nth, c.order, c.x0)
+
+    if c.expected_poly is None:
         return True, got, None  # nothing to compare
-    ok, diff = compare_polys(got, c.expected)
+    ok, diff = compare_polys(got, c.expected_poly)
     return ok, got, diff
 
 
 def run_system_case(
     sc: SystemCase,
 ) -> Tuple[bool, Tuple[sp.Expr, sp.Expr], Tuple[Optional[sp.Expr], Optional[sp.Expr]]]:
-    # Try exact, else series
-    f, g = sp.Function("f")(x), sp.Function("g")(x)
+    # Linear constant-coefficient fast path, then exact, else series
+    f, g = _f_of_x, _g_of_x
     odes = [sp.Eq(f.diff(x), sc.F), sp.Eq(g.diff(x), sc.G)]
     ics = {f.subs(x, sc.x0): sc.f0, g.subs(x, sc.x0): sc.g0}
 
-    got = series_from_exact(odes, [f, g], ics, sc.order, sc.x0)
+    got = None
+    A = _linear_constant_matrix([sc.F, sc.G], [f, g])
+    if A is not None:
+        got = series_linear_constant(A, [sc.f0, sc.g0], sc.order, sc.x0)
+    if got is None:
+        got = series_from_exact(odes, [f, g], ics, sc.order, sc.x0)
     if got is None:
         got = series_system_2x2(sc.F, sc.G, sc.f0, sc.g0, sc.order, sc.x0)  # type: ignore
 
@@ -642,17 +1138,34 @@ def run_system_case(
 
     ok_f, diff_f = (True, None)
     ok_g, diff_g = (True, None)
-    if sc.expected_f is not None:
-        ok_f, diff_f = compare_polys(got_f, sc.expected_f)
-    if sc.expected_g is not None:
-        ok_g, diff_g = compare_polys(got_g, sc.expected_g)
+    if sc.expected_f_poly is not None:
+        ok_f, diff_f = compare_polys(got_f, sc.expected_f_poly)
+    if sc.expected_g_poly is not None:
+        ok_g, diff_g = compare_polys(got_g, sc.expected_g_poly)
 
     return (ok_f and ok_g), (got_f, got_g), (diff_f, diff_g)
 
 
+def _run_scalar_at(index: int):
+    """Process-pool worker: cases hold lambdas, so they are rebuilt by index."""
+    return run_scalar_case(build_cases()[0][index])
+
+
+def _run_system_at(index: int):
+    """Process-pool worker: cases hold lambdas, so they are rebuilt by index."""
+    return run_system_case(build_cases()[1][index])
+
+
 def main():
     scalar_cases, system_cases = build_cases()
 
+    # Cases are independent and CPU-bound in SymPy: run them in worker
+    # processes and report the results in the original order
+    with concurrent.futures.ProcessPoolExecutor() as ex:
+        scalar_results = ex.map(_run_scalar_at, range(len(scalar_cases)))
+        system_results = ex.map(_run_system_at, range(len(system_cases)))
+        scalar_results, system_results = list(scalar_results), list(system_results)
+
     print("=" * 72)
     print("SYMPY CROSS-CHECK OF MAXIMA TEST EXPECTATIONS")
     print("=" * 72)
@@ -660,14 +1173,13 @@ def main():
     failures: List[str] = []
 
     print("\n--- Scalar ODE Cases ---")
-    for c in scalar_cases:
-        ok, got, diff = run_scalar_case(c)
+    for c, (ok, got, diff) in zip(scalar_cases, scalar_results):
         tag = "PASS" if ok else "FAIL"
         print(f"[{tag}] {c.label}")
         if not ok:
             failures.append(c.label)
             print("  Got     :", poly_to_maxima_str(got))
-            print("  Expected:", poly_to_maxima_str(c.expected))
+            print("  Expected:", poly_to_maxima_str(c.expected_poly))
             print("  Diff    :", poly_to_maxima_str(diff))
             # Contextual suggestions
             if "arcsin" in c.label:
@@ -685,19 +1197,18 @@ def main():
         #     print("  Series  :", poly_to_maxima_str(got))
 
     print("\n--- 2×2 System Cases ---")
-    for sc in system_cases:
-        ok, (got_f, got_g), (diff_f, diff_g) = run_system_case(sc)
+    for sc, (ok, (got_f, got_g), (diff_f, diff_g)) in zip(system_cases, system_results):
         tag = "PASS" if ok else "FAIL"
         print(f"[{tag}] {sc.label}")
         if not ok:
             failures.append(sc.label)
             if diff_f is not None:
                 print("  (f) Got     :", poly_to_maxima_str(got_f))
-                print("      Expected:", poly_to_maxima_str(sc.expected_f))
+                print("      Expected:", poly_to_maxima_str(sc.expected_f_poly))
                 print("      Diff    :", poly_to_maxima_str(diff_f))
             if diff_g is not None:
                 print("  (g) Got     :", poly_to_maxima_str(got_g))
-                print("      Expected:", poly_to_maxima_str(sc.expected_g))
+                print("      Expected:", poly_to_maxima_str(sc.expected_g_poly))
                 print("      Diff    :", poly_to_maxima_str(diff_g))
             if "Exp system" in sc.label:
                 print("  SUGGESTION: For f'=f+g, g'=f+g with f(0)=1, g(0)=0,")
@@ -1,12 +1,11 @@
 # Example 000: y' = y, y(0)=1, series about x=0 to order 8
+# The problem itself is defined in ../run_all.py, which runs all examples at once.
 
-from sympy import symbols, Function, Eq, dsolve, series, exp
+import sys
+from pathlib import Path
 
-x = symbols("x")
-y = Function("y")
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
 
-# Exact solution then series
-sol = dsolve(Eq(y(x).diff(x), y(x)), ics={y(0): 1}).rhs
-ser = series(sol, x, 0, 9).removeO()  # up to x^8
+from run_all import run
 
-print("SymPy series (order 8):", ser)
+run("000_linear_exponential")
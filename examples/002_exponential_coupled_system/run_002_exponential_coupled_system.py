@@ -1,18 +1,12 @@
 # Example 002: f' = f + g, g' = f + g; f(0)=1, g(0)=0; series to order 7
+# dsolve finds f = (1 + exp(2x))/2, g = (exp(2x) - 1)/2
+# The problem itself is defined in ../run_all.py, which runs all examples at once.
 
-from sympy import symbols, Function, Eq, dsolve, exp, series
+import sys
+from pathlib import Path
 
-x = symbols("x")
-f = Function("f")
-g = Function("g")
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
 
-# Solve exactly using change of variables:
-# f = (1 + exp(2x))/2, g = (exp(2x) - 1)/2
-f_exact = (1 + exp(2 * x)) / 2
-g_exact = (exp(2 * x) - 1) / 2
+from run_all import run
 
-fser = series(f_exact, x, 0, 8).removeO()  # up to x^7
-gser = series(g_exact, x, 0, 8).removeO()
-
-print("SymPy series f (order 7):", fser)
-print("SymPy series g (order 7):", gser)
+run("002_exponential_coupled_system")
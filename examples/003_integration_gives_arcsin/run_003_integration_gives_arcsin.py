@@ -1,12 +1,12 @@
 # Example 003: y' = 1/sqrt(1 - x**2), y(0)=0; series to order 7
+# dsolve finds y = asin(x) with IC y(0)=0
+# The problem itself is defined in ../run_all.py, which runs all examples at once.
 
-from sympy import symbols, Function, Eq, dsolve, series, asin, sqrt
+import sys
+from pathlib import Path
 
-x = symbols("x")
-y = Function("y")
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
 
-# dsolve finds y = asin(x) with IC y(0)=0
-sol = dsolve(Eq(y(x).diff(x), 1 / sqrt(1 - x**2)), ics={y(0): 0}).rhs
-ser = series(sol, x, 0, 8).removeO()  # up to x^7
+from run_all import run
 
-print("SymPy series (order 7):", ser)
+run("003_integration_gives_arcsin")
@@ -0,0 +1,36 @@
+"""
+Cached dsolve -> series pipeline for the SymPy example scripts.
+
+Results are memoized on the srepr of the inputs, so running several examples
+(or the same IVP twice) in one process solves each problem only once.
+"""
+
+from functools import lru_cache
+
+import sympy as sp
+
+
+@lru_cache(maxsize=None)
+def taylor(ode_srepr, func_srepr, ics_srepr, N):
+    """
+    Truncated Taylor series about 0 (terms below x^N) of the solution of an IVP.
+
+    Arguments are srepr strings so that they can serve as cache keys; returns a
+    tuple of series for a system, a single series otherwise.
+    """
+    func = sp.sympify(func_srepr)
+    x = (func[0] if isinstance(func, list) else func).args[0]
+    sol = sp.dsolve(sp.sympify(ode_srepr), func, ics=dict(sp.sympify(ics_srepr)))
+    if isinstance(sol, list):
+        return tuple(sp.series(s.rhs, x, 0, N).removeO() for s in sol)
+    return sp.series(sol.rhs, x, 0, N).removeO()
+
+
+def taylor_from_ode(ode, func, ics, N):
+    """
+    Series to x^(N-1) of the solution of ode (an Eq, or a list for a system)
+    for func (y(x), or [f(x), g(x)]) with initial conditions ics.
+    """
+    # Sorted so that equal IC dicts give the same cache key
+    ics_items = sorted(ics.items(), key=lambda item: sp.srepr(item[0]))
+    return taylor(sp.srepr(ode), sp.srepr(func), sp.srepr(ics_items), N)
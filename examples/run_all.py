@@ -0,0 +1,68 @@
+# Run every SymPy example in one process, so sympy is imported once and the
+# cached dsolve -> series pipeline (see _common/taylor.py) is shared.
+#
+#   python examples/run_all.py            # all examples
+#   python examples/run_all.py 001 003    # only the examples whose name starts so
+
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+
+from sympy import symbols, Function, Eq, sqrt
+
+from _common.taylor import taylor_from_ode
+
+x = symbols("x")
+y = Function("y")
+f = Function("f")
+g = Function("g")
+
+# (name, ode, func, ics, N): series up to x^(N-1)
+EXAMPLES = [
+    ("000_linear_exponential", Eq(y(x).diff(x), y(x)), y(x), {y(0): 1}, 9),
+    (
+        "001_simple_harmonic_oscillator_system",
+        [Eq(f(x).diff(x), g(x)), Eq(g(x).diff(x), -f(x))],
+        [f(x), g(x)],
+        {f(0): 0, g(0): 1},
+        8,
+    ),
+    (
+        "002_exponential_coupled_system",
+        [Eq(f(x).diff(x), f(x) + g(x)), Eq(g(x).diff(x), f(x) + g(x))],
+        [f(x), g(x)],
+        {f(0): 1, g(0): 0},
+        8,
+    ),
+    (
+        "003_integration_gives_arcsin",
+        Eq(y(x).diff(x), 1 / sqrt(1 - x**2)),
+        y(x),
+        {y(0): 0},
+        8,
+    ),
+]
+
+
+def run(name):
+    """Print the SymPy series of the example called name."""
+    _, ode, func, ics, N = next(ex for ex in EXAMPLES if ex[0] == name)
+    ser = taylor_from_ode(ode, func, ics, N)
+    if isinstance(func, list):
+        for fn, s in zip(func, ser):
+            print(f"SymPy series {fn.func} (order {N - 1}):", s)
+    else:
+        print(f"SymPy series (order {N - 1}):", ser)
+
+
+def main(prefixes=()):
+    for name, *_ in EXAMPLES:
+        if prefixes and not name.startswith(tuple(prefixes)):
+            continue
+        print(f"== {name} ==")
+        run(name)
+
+
+if __name__ == "__main__":
+    main(sys.argv[1:])